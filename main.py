@@ -5,53 +5,17 @@ Orchestrates the complete workflow for generating sales analytics
 
 import argparse
 import sys
-import yaml
 from pathlib import Path
 from datetime import datetime
 
+from src.config import load_config, setup_logging, validate_config
+from src.data_cache import CleanDataCache
 from src.data_ingestion import GoogleSheetsIngestion
 from src.data_processing import DataProcessor
 from src.kpi_calculator import KPICalculator
 from src.visualizations import ChartGenerator
 
 
-def load_config(config_path: str = "config.yaml") -> dict:
-    """Load configuration from YAML file"""
-    try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        return config
-    except FileNotFoundError:
-        print(f"Error: Configuration file not found at {config_path}")
-        print("Please create a config.yaml file. See README for instructions.")
-        sys.exit(1)
-    except yaml.YAMLError as e:
-        print(f"Error parsing configuration file: {e}")
-        sys.exit(1)
-
-
-def validate_config(config: dict) -> bool:
-    """Validate that configuration has required fields"""
-    required_fields = [
-        ('google_sheets', 'sheet_id'),
-        ('google_sheets', 'credentials_path'),
-        ('data', 'columns')
-    ]
-    
-    for *path, field in required_fields:
-        current = config
-        for key in path:
-            if key not in current:
-                print(f"Error: Missing configuration: {'.'.join(path)}.{field}")
-                return False
-            current = current[key]
-        if field not in current:
-            print(f"Error: Missing configuration: {'.'.join(path)}.{field}")
-            return False
-    
-    return True
-
-
 def format_date_range(start_date: str, end_date: str) -> str:
     """Format date range string for display"""
     return f"{start_date} to {end_date}"
@@ -82,9 +46,22 @@ def main():
         default=None,
         help='Number of days to include (overrides config)'
     )
+    parser.add_argument(
+        '--export',
+        action='store_true',
+        help='Render charts at the print resolution (export_dpi in config)'
+    )
+    parser.add_argument(
+        '--dashboard',
+        action='store_true',
+        help='Also save all charts as panels of a single dashboard image'
+    )
     
     args = parser.parse_args()
     
+    # Pipeline modules log their progress, shown inline with the steps below
+    setup_logging()
+    
     print("=" * 60)
     print("Sales Analytics Dashboard")
     print("=" * 60)
@@ -104,12 +81,18 @@ def main():
     credentials_path = config['google_sheets']['credentials_path']
     column_mapping = config['data']['columns']
     days_to_include = args.days if args.days is not None else config['data'].get('days_to_include', 30)
+    cache_dir = config['data'].get('cache_dir')
     
     viz_config = config.get('visualizations', {})
     output_dir = viz_config.get('output_dir', 'output/charts')
-    dpi = viz_config.get('dpi', 300)
+    dpi = viz_config.get('dpi', 100)
+    if args.export:
+        dpi = viz_config.get('export_dpi', 300)
     figure_size = tuple(viz_config.get('figure_size', [12, 8]))
     colors = viz_config.get('colors', {})
+    chart_format = viz_config.get('output_format', 'png')
+    fast_mode = viz_config.get('fast_mode', False)
+    chart_workers = viz_config.get('chart_workers', 0)
     
     if sheet_id == "YOUR_SHEET_ID_HERE":
         print("Error: Please update config.yaml with your Google Sheet ID")
@@ -122,14 +105,14 @@ def main():
         ingestion.authenticate()
         print("Authenticated with Google Sheets API")
         
-        raw_data = ingestion.fetch_data(sheet_id, worksheet_name)
-        print(f"Fetched {len(raw_data)} rows of data")
-        print()
-        
-        print("Step 2: Processing and cleaning data...")
         processor = DataProcessor(column_mapping)
-        clean_data = processor.clean_data(raw_data)
+        data_cache = CleanDataCache(cache_dir)
+        clean_data = data_cache.fetch_clean_data(
+            ingestion, processor, sheet_id, worksheet_name
+        )
+        print()
         
+        print("Step 2: Processing data...")
         filtered_data = processor.filter_by_date_range(clean_data, days_to_include)
         
         validation = processor.validate_data_quality(filtered_data)
@@ -176,7 +159,11 @@ def main():
         print()
         
         print("Step 5: Generating visualizations...")
-        chart_generator = ChartGenerator(output_dir, dpi, figure_size, colors)
+        chart_generator = ChartGenerator(
+            output_dir, dpi, figure_size, colors,
+            workers=chart_workers, output_format=chart_format,
+            fast_mode=fast_mode
+        )
         
         date_range_str = format_date_range(
             summary_stats['date_range']['start'],
@@ -192,6 +179,17 @@ def main():
             column_mapping=column_mapping,
             date_range=date_range_str
         )
+        if args.dashboard:
+            chart_paths['dashboard'] = chart_generator.generate_dashboard(
+                person_name=args.name,
+                totals=totals,
+                rates=rates,
+                daily_df=daily_trends,
+                comparison=comparison,
+                column_mapping=column_mapping,
+                date_range=date_range_str
+            )
+        chart_generator.close()
         
         print()
         print("=" * 60)
@@ -3,45 +3,45 @@ Send Monthly Reports
 Automatically generates and emails performance reports to all team members
 """
 
+import logging
 import sys
 import yaml
 from pathlib import Path
 from datetime import datetime
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 
+from src.config import (
+    SafeLoader, flush_logs, load_config, setup_logging, validate_config
+)
+from src.data_cache import CleanDataCache
 from src.data_ingestion import GoogleSheetsIngestion
 from src.data_processing import DataProcessor
 from src.kpi_calculator import KPICalculator
 from src.visualizations import ChartGenerator
 from src.email_sender import EmailSender
 
+# Progress is timestamped and buffered, since this runs unattended
+LOG_FORMAT = '%(asctime)s %(message)s'
 
-def load_config(config_path: str = "config.yaml") -> dict:
-    """Load configuration from YAML file"""
-    try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        return config
-    except FileNotFoundError:
-        print(f"Error: Configuration file not found at {config_path}")
-        sys.exit(1)
-    except yaml.YAMLError as e:
-        print(f"Error parsing configuration file: {e}")
-        sys.exit(1)
+logger = logging.getLogger(__name__)
+
+# Shared report inputs, set once per worker process by _init_report_worker
+_worker_state = {}
 
 
 def load_team_roster(roster_path: str = "team_roster.yaml") -> list:
     """Load team roster from YAML file"""
     try:
         with open(roster_path, 'r') as f:
-            roster = yaml.safe_load(f)
+            roster = yaml.load(f, Loader=SafeLoader)
         return roster.get('team_members', [])
     except FileNotFoundError:
-        print(f"Error: Team roster file not found at {roster_path}")
-        print("Please create team_roster.yaml with your team members")
+        logger.error(f"Error: Team roster file not found at {roster_path}")
+        logger.error("Please create team_roster.yaml with your team members")
         sys.exit(1)
     except yaml.YAMLError as e:
-        print(f"Error parsing team roster file: {e}")
+        logger.error(f"Error parsing team roster file: {e}")
         sys.exit(1)
 
 
@@ -51,22 +51,36 @@ def generate_report_for_person(
     calculator: KPICalculator,
     chart_generator: ChartGenerator,
     filtered_data,
-    column_mapping: dict
+    team_data,
+    person_index: dict,
+    column_mapping: dict,
+    all_totals=None
 ):
     """
     Generate charts and calculate KPIs for a specific person
     
+    Team-wide aggregates are computed once by the caller and passed in as
+    team_data, so they are not rebuilt for every team member. person_index
+    is the lookup built by DataProcessor.index_by_person. all_totals is
+    the output of KPICalculator.calculate_all_totals keyed by lowercase
+    name, used for members whose name matches exactly.
+    
     Returns:
         tuple: (chart_paths, totals, rates, summary_stats, date_range_str) or None if error
     """
     try:
         # Filter for specific person
-        person_data = processor.filter_by_person(filtered_data, name)
-        team_data = processor.get_team_data(filtered_data)
+        person_data = processor.filter_by_person(
+            filtered_data, name, person_index
+        )
         
         # Calculate KPIs
-        totals = calculator.calculate_totals(person_data)
-        rates = calculator.calculate_conversion_rates(totals)
+        key = name.lower()
+        if all_totals is not None and key in all_totals.index:
+            totals, rates = calculator.split_kpis(all_totals.loc[key])
+        else:
+            totals = calculator.calculate_totals(person_data)
+            rates = calculator.calculate_conversion_rates(totals)
         daily_trends = calculator.calculate_daily_trends(person_data)
         comparison = calculator.calculate_team_comparison(totals, team_data)
         summary_stats = calculator.get_summary_stats(person_data)
@@ -88,145 +102,184 @@ def generate_report_for_person(
         return chart_paths, totals, rates, summary_stats, date_range_str
         
     except ValueError as e:
-            print(f"  Warning: Skipping {name}: {str(e)}")
+            logger.warning(f"Skipping {name}: {str(e)}")
             return None
     except Exception as e:
-            print(f"  Error processing {name}: {str(e)}")
+            logger.error(f"Error processing {name}: {str(e)}")
             return None
 
 
+def _init_report_worker(state: dict):
+    """Store the shared report inputs in a worker process"""
+    setup_logging(buffered=True, fmt=LOG_FORMAT)
+    _worker_state.update(state)
+
+
+def _generate_report_in_worker(name: str):
+    """Generate one person's report from the worker's shared inputs"""
+    try:
+        return generate_report_for_person(name, **_worker_state)
+    finally:
+        # Worker processes exit without flushing, so write each report's
+        # log records out as one batch
+        flush_logs()
+
+
 def main():
     """Main execution function"""
     
-    print("=" * 70)
-    print("📧 MONTHLY SALES REPORTS - AUTOMATED EMAIL SENDER")
-    print("=" * 70)
-    print()
+    setup_logging(buffered=True, fmt=LOG_FORMAT)
     
-    print("Loading configuration...")
+    logger.info("📧 MONTHLY SALES REPORTS - AUTOMATED EMAIL SENDER")
+    logger.info("Loading configuration...")
     config = load_config()
     
+    if not validate_config(config):
+        sys.exit(1)
+    
     email_config = config.get('email', {})
     if not email_config.get('enabled', False):
-        print("Error: Email sending is disabled in config.yaml")
-        print("Set 'email: enabled: true' to send emails")
+        logger.error("Error: Email sending is disabled in config.yaml")
+        logger.error("Set 'email: enabled: true' to send emails")
         sys.exit(1)
     
-    print("Configuration loaded")
+    logger.info("Configuration loaded")
     
-    print("Loading team roster...")
+    logger.info("Loading team roster...")
     team_members = load_team_roster()
-    print(f"Found {len(team_members)} team members")
-    print()
+    logger.info(f"Found {len(team_members)} team members")
     
     sheet_id = config['google_sheets']['sheet_id']
     worksheet_name = config['google_sheets'].get('worksheet_name', 'Form Responses 1')
     credentials_path = config['google_sheets']['credentials_path']
     column_mapping = config['data']['columns']
     days_to_include = config['data'].get('days_to_include', 30)
+    cache_dir = config['data'].get('cache_dir')
     
     viz_config = config.get('visualizations', {})
     output_dir = viz_config.get('output_dir', 'output/charts')
-    dpi = viz_config.get('dpi', 300)
+    dpi = viz_config.get('dpi', 100)
     figure_size = tuple(viz_config.get('figure_size', [12, 8]))
     colors = viz_config.get('colors', {})
+    chart_format = viz_config.get('output_format', 'png')
+    fast_mode = viz_config.get('fast_mode', False)
     
     if sheet_id == "YOUR_SHEET_ID_HERE":
-        print("Error: Please update config.yaml with your Google Sheet ID")
+        logger.error("Error: Please update config.yaml with your Google Sheet ID")
         sys.exit(1)
     
     try:
-        print("Initializing email sender...")
+        logger.info("Initializing email sender...")
         email_sender = EmailSender(email_config)
         
         if not email_sender.test_connection():
-            print("Email connection test failed. Please check your SMTP settings.")
+            logger.error("Email connection test failed. Please check your SMTP settings.")
             sys.exit(1)
-        print()
         
-        print("Fetching data from Google Sheets...")
+        logger.info("Fetching data from Google Sheets...")
         ingestion = GoogleSheetsIngestion(credentials_path)
         ingestion.authenticate()
-        raw_data = ingestion.fetch_data(sheet_id, worksheet_name)
-        print(f"Fetched {len(raw_data)} rows of data")
-        print()
-        
-        print("Processing data...")
         processor = DataProcessor(column_mapping)
-        clean_data = processor.clean_data(raw_data)
+        data_cache = CleanDataCache(cache_dir)
+        clean_data = data_cache.fetch_clean_data(
+            ingestion, processor, sheet_id, worksheet_name
+        )
+        
+        logger.info("Processing data...")
         filtered_data = processor.filter_by_date_range(clean_data, days_to_include)
         
         validation = processor.validate_data_quality(filtered_data)
         if validation['warnings']:
-            print("Data quality warnings:")
             for warning in validation['warnings']:
-                print(f"  - {warning}")
-        print("Data processed")
-        print()
+                logger.warning(f"Data quality warning: {warning}")
+        # Team aggregates are identical for every member, compute them once
+        team_data = processor.get_team_data(filtered_data)
         
+        # Index by timestamp before splitting per member, so each member's
+        # KPIs reuse the parsed dates
         calculator = KPICalculator(column_mapping)
-        chart_generator = ChartGenerator(output_dir, dpi, figure_size, colors)
+        filtered_data = calculator.prepare(filtered_data)
+        person_index = processor.index_by_person(filtered_data)
+        
+        # Totals and rates for every member from a single groupby, keyed
+        # like person_index
+        all_totals = calculator.calculate_all_totals(
+            filtered_data, filtered_data[column_mapping['name']].str.lower()
+        )
+        logger.info("Data processed")
+        
+        chart_generator = ChartGenerator(
+            output_dir, dpi, figure_size, colors,
+            output_format=chart_format, fast_mode=fast_mode
+        )
         
         # Process each team member
-        print("=" * 70)
-        print("GENERATING AND SENDING REPORTS")
-        print("=" * 70)
-        print()
+        logger.info("GENERATING AND SENDING REPORTS")
         
         successful_sends = 0
         failed_sends = 0
         skipped = 0
         
-        for member in team_members:
-            name = member['name']
-            email = member['email']
-            
-            print(f"Processing: {name} ({email})")
-            
-            result = generate_report_for_person(
-                name, processor, calculator, chart_generator,
-                filtered_data, column_mapping
-            )
-            
+        # Chart rendering is CPU-bound, so members are rendered in separate
+        # processes. The shared data is shipped to each worker once.
+        worker_state = {
+            'processor': processor,
+            'calculator': calculator,
+            'chart_generator': chart_generator,
+            'filtered_data': filtered_data,
+            'team_data': team_data,
+            'person_index': person_index,
+            'column_mapping': column_mapping,
+            'all_totals': all_totals
+        }
+        names = [member['name'] for member in team_members]
+        
+        logger.info(f"Generating reports for {len(names)} team members...")
+        # Write pending records now so forked workers don't inherit them
+        flush_logs()
+        with ProcessPoolExecutor(
+            initializer=_init_report_worker,
+            initargs=(worker_state,)
+        ) as pool:
+            results = list(pool.map(_generate_report_in_worker, names))
+        
+        jobs = []
+        for member, result in zip(team_members, results):
             if result is None:
                 skipped += 1
-                continue
-            
+            else:
+                jobs.append((member, result))
+        
+        # Emails go out over a few concurrent SMTP connections
+        email_jobs = []
+        for member, result in jobs:
             chart_paths, totals, rates, summary_stats, date_range_str = result
-            
-            print(f"  Sending email...")
-            success = email_sender.send_report(
-                to_email=email,
-                person_name=name,
-                chart_paths=chart_paths,
-                totals=totals,
-                rates=rates,
-                date_range=date_range_str
-            )
-            
+            email_jobs.append({
+                'to_email': member['email'],
+                'person_name': member['name'],
+                'chart_paths': chart_paths,
+                'totals': totals,
+                'rates': rates,
+                'date_range': date_range_str
+            })
+        
+        logger.info(f"Sending {len(email_jobs)} emails...")
+        for success in email_sender.send_reports_bulk(email_jobs):
             if success:
-                print(f"  Email sent successfully to {email}")
                 successful_sends += 1
             else:
                 failed_sends += 1
-            
-            print()
         
-        print("=" * 70)
-        print("SUMMARY")
-        print("=" * 70)
-        print(f"Successfully sent: {successful_sends}")
+        logger.info("SUMMARY")
+        logger.info(f"Successfully sent: {successful_sends}")
         if failed_sends > 0:
-            print(f"Failed to send: {failed_sends}")
+            logger.warning(f"Failed to send: {failed_sends}")
         if skipped > 0:
-            print(f"Skipped (no data): {skipped}")
-        print()
-        print("Monthly reports complete!")
+            logger.info(f"Skipped (no data): {skipped}")
+        logger.info("Monthly reports complete!")
         
     except Exception as e:
-        print(f"\nUnexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Unexpected error: {e}")
         sys.exit(1)
 
 
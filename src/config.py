@@ -0,0 +1,106 @@
+"""
+Configuration Module
+Loads the YAML configuration shared by the command-line scripts
+"""
+
+import copy
+import functools
+import logging
+import logging.handlers
+import os
+import sys
+import yaml
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# Number of log records held in memory before a buffered log is written
+LOG_BUFFER_CAPACITY = 100
+
+# Settings every configuration must define, as paths of nested keys
+REQUIRED_SETTINGS = (
+    ('google_sheets', 'sheet_id'),
+    ('google_sheets', 'credentials_path'),
+    ('data', 'columns', 'timestamp'),
+    ('data', 'columns', 'name'),
+    ('data', 'columns', 'doors_knocked'),
+    ('data', 'columns', 'homeowners_talked'),
+    ('data', 'columns', 'qualified_leads'),
+    ('data', 'columns', 'appointments_set'),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_config(config_path: str, mtime_ns: int) -> dict:
+    """
+    Parse a YAML file, cached per path and modification time
+    
+    Args:
+        config_path: Path to the YAML file
+        mtime_ns: File modification time, so edits invalidate the cache
+    
+    Returns:
+        dict: Parsed configuration
+    """
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def load_config(config_path: str = "config.yaml") -> dict:
+    """Load configuration from YAML file"""
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+        config = _parse_config(config_path, mtime_ns)
+        return copy.deepcopy(config)
+    except FileNotFoundError:
+        print(f"Error: Configuration file not found at {config_path}")
+        print("Please create a config.yaml file. See README for instructions.")
+        sys.exit(1)
+    except yaml.YAMLError as e:
+        print(f"Error parsing configuration file: {e}")
+        sys.exit(1)
+
+
+def validate_config(config: dict) -> bool:
+    """Validate that configuration has required fields"""
+    for path in REQUIRED_SETTINGS:
+        current = config
+        for key in path:
+            if not isinstance(current, dict) or key not in current:
+                print(f"Error: Missing configuration: {'.'.join(path)}")
+                return False
+            current = current[key]
+    
+    return True
+
+
+def setup_logging(buffered: bool = False, fmt: str = '%(message)s'):
+    """
+    Send log records from the pipeline modules to stdout
+    
+    Args:
+        buffered: Hold records in memory and write them in batches
+            (errors and flush_logs() write immediately)
+        fmt: Log record format
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter(fmt))
+    
+    if buffered:
+        handler = logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=handler
+        )
+    
+    logging.basicConfig(level=logging.INFO, handlers=[handler], force=True)
+
+
+def flush_logs():
+    """Write out any buffered log records"""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
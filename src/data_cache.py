@@ -0,0 +1,204 @@
+"""
+Data Cache Module
+Caches cleaned sheet data locally so unchanged sheets are not re-processed
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.data_ingestion import GoogleSheetsIngestion
+from src.data_processing import DataProcessor
+
+logger = logging.getLogger(__name__)
+
+# Key in the Parquet schema metadata holding the cache state
+STATE_METADATA_KEY = b'sales_dashboard_cache'
+
+
+def _hash_rows(digest, df: pd.DataFrame):
+    """
+    Add raw rows to a running digest
+    
+    The same cell can come back as a Python or NumPy number depending on
+    the rest of its column, and whole numbers as ints or floats, so values
+    are normalised to strings first.
+    
+    Args:
+        digest: hashlib object to update
+        df: Raw rows from the sheet
+    """
+    for row in df.itertuples(index=False):
+        values = [
+            str(int(value)) if isinstance(value, float) and value.is_integer()
+            else str(value)
+            for value in row
+        ]
+        digest.update(json.dumps(values).encode('utf-8'))
+
+
+class CleanDataCache:
+    """Stores cleaned data as Parquet files tagged with the sheet revision"""
+    
+    def __init__(self, cache_dir: Optional[str]):
+        """
+        Initialize data cache
+        
+        Args:
+            cache_dir: Directory for cache files (None disables caching)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+    
+    def _cache_prefix(
+        self,
+        sheet_id: str,
+        worksheet_name: str,
+        column_mapping: dict
+    ) -> str:
+        """
+        Build the cache file name prefix for a data source
+        
+        The worksheet and column mapping are part of the key because the
+        cleaned output depends on them.
+        
+        Args:
+            sheet_id: Google Sheet ID
+            worksheet_name: Name of worksheet
+            column_mapping: Column mapping used for cleaning
+        
+        Returns:
+            str: File name prefix
+        """
+        source = json.dumps([worksheet_name, column_mapping], sort_keys=True)
+        digest = hashlib.sha1(source.encode('utf-8')).hexdigest()[:8]
+        return f"{sheet_id}_{digest}"
+    
+    def _load_state(self, data_path: Path) -> Optional[Dict]:
+        """
+        Read the state stored in a cached Parquet file
+        
+        Args:
+            data_path: Path to the cached Parquet file
+            
+        Returns:
+            Dict: Stored revision, row count and raw row digest, or None if
+                there is no usable cache for the source
+        """
+        if not data_path.exists():
+            return None
+        
+        try:
+            metadata = pq.read_schema(data_path).metadata or {}
+            return json.loads(metadata[STATE_METADATA_KEY])
+        except (OSError, KeyError, ValueError, pa.ArrowException):
+            return None
+    
+    def _write_cache(self, df: pd.DataFrame, data_path: Path, state: Dict):
+        """
+        Atomically write cleaned data together with its state
+        
+        The revision and row count live in the Parquet schema metadata so
+        the data and the state can never get out of step, and the file is
+        written to a temporary path and moved into place so an interrupted
+        run leaves the previous cache intact.
+        
+        Args:
+            df: Cleaned data
+            data_path: Path to the cached Parquet file
+            state: Revision, row count and raw row digest the data was
+                built from
+        """
+        table = pa.Table.from_pandas(df)
+        metadata = dict(table.schema.metadata or {})
+        metadata[STATE_METADATA_KEY] = json.dumps(state).encode('utf-8')
+        table = table.replace_schema_metadata(metadata)
+        
+        tmp_path = data_path.with_name(data_path.name + '.tmp')
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, data_path)
+    
+    def fetch_clean_data(
+        self,
+        ingestion: GoogleSheetsIngestion,
+        processor: DataProcessor,
+        sheet_id: str,
+        worksheet_name: str
+    ) -> pd.DataFrame:
+        """
+        Return cleaned sheet data, reusing as much cached work as possible
+        
+        If the sheet has not been modified since the cache was written the
+        cached data is returned as-is. Otherwise the sheet is fetched and,
+        if the cached rows are unchanged, only rows appended after them
+        are cleaned. Any edit or deletion cleans the whole sheet again.
+        
+        Args:
+            ingestion: Authenticated Google Sheets ingestion
+            processor: Data processor used to clean fetched rows
+            sheet_id: Google Sheet ID
+            worksheet_name: Name of worksheet
+            
+        Returns:
+            pd.DataFrame: Cleaned data
+        """
+        # Only the mapped columns are needed for cleaning
+        columns = list(processor.column_mapping.values())
+        
+        if self.cache_dir is None:
+            raw_data = ingestion.fetch_data(
+                sheet_id, worksheet_name, columns=columns
+            )
+            return processor.clean_data(raw_data)
+        
+        revision = ingestion.get_last_update_time(sheet_id)
+        prefix = self._cache_prefix(
+            sheet_id, worksheet_name, processor.column_mapping
+        )
+        data_path = self.cache_dir / f"{prefix}.parquet"
+        state = self._load_state(data_path)
+        
+        if state is not None and state['revision'] == revision:
+            df_clean = pd.read_parquet(data_path)
+            logger.info(f"Sheet unchanged, loaded {len(df_clean)} cleaned rows from cache")
+            return df_clean
+        
+        raw_data = ingestion.fetch_data(
+            sheet_id, worksheet_name, columns=columns
+        )
+        
+        # Rows already cached are only reused if none of them has been
+        # edited or deleted since, checked against a digest of the raw rows
+        cached_rows = state['rows'] if state is not None else 0
+        digest = hashlib.sha1()
+        _hash_rows(digest, raw_data.iloc[:cached_rows])
+        reusable = (
+            state is not None
+            and len(raw_data) >= cached_rows
+            and digest.hexdigest() == state.get('digest')
+        )
+        _hash_rows(digest, raw_data.iloc[cached_rows:])
+        
+        if reusable:
+            new_rows = raw_data.iloc[cached_rows:].reset_index(drop=True)
+            df_clean = processor.merge_incremental(
+                pd.read_parquet(data_path), new_rows
+            )
+            logger.info(f"Cleaned {len(new_rows)} new rows and reused {cached_rows} cached rows")
+        else:
+            if state is not None:
+                logger.info("Cached rows were edited or deleted, cleaning the whole sheet again")
+            df_clean = processor.clean_data(raw_data)
+        
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._write_cache(
+            df_clean, data_path,
+            {'revision': revision, 'rows': len(raw_data), 'digest': digest.hexdigest()}
+        )
+        
+        return df_clean
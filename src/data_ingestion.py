@@ -3,10 +3,16 @@ Data Ingestion Module
 Handles Google Sheets API authentication and data fetching
 """
 
+import logging
 import gspread
+from gspread.utils import (
+    DateTimeOption, Dimension, ValueRenderOption, rowcol_to_a1
+)
 from google.oauth2.service_account import Credentials
 import pandas as pd
-from typing import Optional
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
 
 
 class GoogleSheetsIngestion:
@@ -21,6 +27,7 @@ class GoogleSheetsIngestion:
         """
         self.credentials_path = credentials_path
         self.client = None
+        self._spreadsheets = {}
     
     def authenticate(self) -> bool:
         """
@@ -53,7 +60,9 @@ class GoogleSheetsIngestion:
     def fetch_data(
         self,
         sheet_id: str,
-        worksheet_name: str = "Form Responses 1"
+        worksheet_name: str = "Form Responses 1",
+        start_row: int = 2,
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Fetch data from Google Sheet and return as pandas DataFrame
@@ -61,6 +70,10 @@ class GoogleSheetsIngestion:
         Args:
             sheet_id: Google Sheet ID from the URL
             worksheet_name: Name of the worksheet/tab
+            start_row: First sheet row to fetch (row 1 is always read as
+                the header, so the default fetches every row)
+            columns: Header names of the columns to fetch (None fetches
+                all columns)
             
         Returns:
             pd.DataFrame: Data from the sheet
@@ -70,21 +83,44 @@ class GoogleSheetsIngestion:
         
         try:
             # Open the spreadsheet
-            spreadsheet = self.client.open_by_key(sheet_id)
+            spreadsheet = self._open_spreadsheet(sheet_id)
             
             # Get the specific worksheet
             worksheet = spreadsheet.worksheet(worksheet_name)
             
-            # Get all values
-            data = worksheet.get_all_values()
+            # Numbers are returned as numbers rather than display strings
+            # so they don't need to be re-parsed later
+            render_options = {
+                'value_render_option': ValueRenderOption.unformatted,
+                'date_time_render_option': DateTimeOption.formatted_string
+            }
+            
+            if columns is not None:
+                data = self._fetch_columns(
+                    worksheet, columns, start_row, render_options
+                )
+            elif start_row <= 2:
+                data = worksheet.get_all_values(**render_options)
+            elif start_row > worksheet.row_count:
+                data = worksheet.get_values('1:1', **render_options)
+            else:
+                # Fetch the header and only the requested rows in one call
+                header, rows = worksheet.batch_get(
+                    ['1:1', f'{start_row}:{worksheet.row_count}'],
+                    **render_options
+                )
+                data = header + rows
             
             if not data:
                 raise ValueError("No data found in the worksheet")
             
-            # Convert to DataFrame (first row as headers)
-            df = pd.DataFrame(data[1:], columns=data[0])
+            # Convert to DataFrame (first row as headers), padding rows
+            # whose trailing cells are empty
+            header = data[0]
+            rows = [row + [''] * (len(header) - len(row)) for row in data[1:]]
+            df = pd.DataFrame(rows, columns=header)
             
-            print(f"Successfully fetched {len(df)} rows from Google Sheets")
+            logger.info(f"Successfully fetched {len(df)} rows from Google Sheets")
             return df
             
         except gspread.exceptions.SpreadsheetNotFound:
@@ -102,11 +138,105 @@ class GoogleSheetsIngestion:
         except Exception as e:
             raise Exception(f"Failed to fetch data: {str(e)}")
     
+    def get_last_update_time(self, sheet_id: str) -> str:
+        """
+        Get the time the spreadsheet was last modified
+        
+        Args:
+            sheet_id: Google Sheet ID from the URL
+            
+        Returns:
+            str: RFC 3339 modification timestamp from Google Drive
+        """
+        if self.client is None:
+            raise Exception("Not authenticated. Call authenticate() first.")
+        
+        try:
+            return self._open_spreadsheet(sheet_id).get_lastUpdateTime()
+        except gspread.exceptions.SpreadsheetNotFound:
+            raise Exception(
+                f"Spreadsheet not found with ID: {sheet_id}\n"
+                "Please ensure:\n"
+                "1. The Sheet ID is correct\n"
+                "2. The sheet is shared with your service account email"
+            )
+    
+    def _fetch_columns(
+        self,
+        worksheet: gspread.Worksheet,
+        columns: List[str],
+        start_row: int,
+        render_options: dict
+    ) -> list:
+        """
+        Fetch only the named columns, so unused columns of a wide sheet
+        are never transferred
+        
+        Args:
+            worksheet: Worksheet to read
+            columns: Header names of the columns to fetch
+            start_row: First sheet row to fetch
+            render_options: Value and date render options
+            
+        Returns:
+            list: Header row followed by the data rows
+            
+        Raises:
+            ValueError: If any of the columns is not in the sheet header
+        """
+        sheet_header = worksheet.row_values(1, **render_options)
+        missing_columns = [name for name in columns if name not in sheet_header]
+        if missing_columns:
+            raise ValueError(
+                f"Missing required columns: {', '.join(missing_columns)}\n"
+                f"Available columns: {', '.join(sheet_header)}\n"
+                "Please update your config.yaml with the correct column names."
+            )
+        
+        positions = [sheet_header.index(name) + 1 for name in columns]
+        header = list(columns)
+        
+        if not positions or start_row > worksheet.row_count:
+            return [header]
+        
+        ranges = []
+        for pos in positions:
+            letter = rowcol_to_a1(1, pos)[:-1]
+            ranges.append(f'{letter}{start_row}:{letter}{worksheet.row_count}')
+        
+        value_ranges = worksheet.batch_get(
+            ranges, major_dimension=Dimension.cols, **render_options
+        )
+        column_values = [values[0] if values else [] for values in value_ranges]
+        
+        # Trailing empty cells are omitted, so columns can differ in length
+        row_count = max(len(values) for values in column_values)
+        column_values = [
+            values + [''] * (row_count - len(values)) for values in column_values
+        ]
+        
+        return [header] + [list(row) for row in zip(*column_values)]
+    
+    def _open_spreadsheet(self, sheet_id: str) -> gspread.Spreadsheet:
+        """
+        Open a spreadsheet, reusing the handle from earlier calls
+        
+        Args:
+            sheet_id: Google Sheet ID from the URL
+            
+        Returns:
+            gspread.Spreadsheet: The opened spreadsheet
+        """
+        if sheet_id not in self._spreadsheets:
+            self._spreadsheets[sheet_id] = self.client.open_by_key(sheet_id)
+        return self._spreadsheets[sheet_id]
+    
     def fetch_data_with_retry(
         self,
         sheet_id: str,
         worksheet_name: str = "Form Responses 1",
-        max_retries: int = 3
+        max_retries: int = 3,
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Fetch data with automatic retry on failure
@@ -115,17 +245,19 @@ class GoogleSheetsIngestion:
             sheet_id: Google Sheet ID
             worksheet_name: Name of worksheet
             max_retries: Maximum number of retry attempts
+            columns: Header names of the columns to fetch (None fetches
+                all columns)
             
         Returns:
             pd.DataFrame: Data from the sheet
         """
         for attempt in range(max_retries):
             try:
-                return self.fetch_data(sheet_id, worksheet_name)
+                return self.fetch_data(sheet_id, worksheet_name, columns=columns)
             except Exception as e:
                 if attempt == max_retries - 1:
                     raise
-                print(f"Attempt {attempt + 1} failed, retrying...")
+                logger.warning(f"Attempt {attempt + 1} failed, retrying...")
         
         raise Exception("Failed to fetch data after maximum retries")
 
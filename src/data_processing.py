@@ -3,11 +3,31 @@ Data Processing Module
 Handles data cleaning, validation, and transformation
 """
 
+import logging
+import re
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 
+logger = logging.getLogger(__name__)
+
+
+def _stages_exceeding_previous(funnel: np.ndarray) -> np.ndarray:
+    """
+    Flag funnel stages that exceed the preceding stage in any row
+    
+    Args:
+        funnel: 2-D array with one column per funnel stage, in funnel order
+        
+    Returns:
+        np.ndarray: One boolean per stage after the first
+    """
+    if funnel.shape[0] == 0:
+        return np.zeros(max(funnel.shape[1] - 1, 0), dtype=bool)
+    
+    return np.greater(funnel[:, 1:], funnel[:, :-1]).any(axis=0)
+
 
 class DataProcessor:
     """Processes and cleans sales data"""
@@ -52,26 +72,95 @@ class DataProcessor:
             self.column_mapping['appointments_set']
         ]
         
-        for col in numeric_columns:
-            df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
+        # Coerce, fill missing and non-finite values with 0 and clip
+        # negatives in one pass over the numeric block instead of column
+        # by column
+        numeric_block = (
+            df_clean[numeric_columns]
+            .apply(pd.to_numeric, errors='coerce')
+            .replace([np.inf, -np.inf], np.nan)
+            .fillna(0)
+            .clip(lower=0)
+            .to_numpy(dtype=np.float64)
+        )
         
-        # Clean name column (strip whitespace, title case)
+        # Counts are whole numbers, so store them as int32 rather than
+        # float64 to halve the memory moved by later sums and comparisons.
+        # Fractional entries are rounded rather than truncated.
+        numeric_block = np.rint(numeric_block)
+        if numeric_block.max(initial=0) > np.iinfo(np.int32).max:
+            raise ValueError(
+                "Numeric values are too large to be activity counts.\n"
+                "Please check the numeric columns in your Google Sheet."
+            )
+        df_clean[numeric_columns] = numeric_block.astype(np.int32)
+        
+        # Clean name column (strip whitespace, title case) using Arrow's
+        # string kernels rather than per-cell Python string methods
         name_col = self.column_mapping['name']
-        df_clean[name_col] = df_clean[name_col].str.strip().str.title()
+        df_clean[name_col] = (
+            df_clean[name_col]
+            .astype('string[pyarrow]')
+            .str.strip()
+            .str.title()
+        )
         
         # Remove rows with invalid timestamps
         df_clean = df_clean[df_clean[timestamp_col].notna()].copy()
         
-        # Fill missing numeric values with 0
-        df_clean[numeric_columns] = df_clean[numeric_columns].fillna(0)
+        # Store names as categories so grouping by person hashes integer
+        # codes instead of strings
+        df_clean[name_col] = df_clean[name_col].astype('category')
         
-        # Ensure all numeric values are non-negative
-        for col in numeric_columns:
-            df_clean[col] = df_clean[col].clip(lower=0)
+        # Keep rows in time order so date filters can binary search
+        df_clean = df_clean.sort_values(
+            timestamp_col, kind='mergesort'
+        ).reset_index(drop=True)
         
-        print(f"Data cleaned: {len(df_clean)} valid rows")
+        logger.info(f"Data cleaned: {len(df_clean)} valid rows")
         return df_clean
     
+    def merge_incremental(
+        self,
+        cached: pd.DataFrame,
+        new_rows: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Append newly fetched raw rows to previously cleaned data
+        
+        Only new_rows are cleaned, so the cost scales with the number of
+        rows added since the cached data was built.
+        
+        Args:
+            cached: DataFrame previously returned by clean_data
+            new_rows: Raw rows fetched since the cached data was built
+            
+        Returns:
+            pd.DataFrame: Cleaned DataFrame covering both inputs
+        """
+        if len(new_rows) == 0:
+            return cached
+        
+        df_merged = pd.concat(
+            [cached, self.clean_data(new_rows)],
+            ignore_index=True
+        )
+        
+        # Concatenating categoricals with different categories falls back
+        # to plain strings, so restore the category dtype
+        name_col = self.column_mapping['name']
+        df_merged[name_col] = df_merged[name_col].astype('category')
+        
+        # Late form submissions can carry earlier timestamps than the
+        # cached rows, so restore time order if needed
+        timestamp_col = self.column_mapping['timestamp']
+        if not df_merged[timestamp_col].is_monotonic_increasing:
+            df_merged = df_merged.sort_values(
+                timestamp_col, kind='mergesort'
+            ).reset_index(drop=True)
+        
+        return df_merged
+    
     def _validate_columns(self, df: pd.DataFrame):
         """
         Validate that required columns exist
@@ -110,21 +199,56 @@ class DataProcessor:
             pd.DataFrame: Filtered DataFrame
         """
         if days <= 0:
-            print(f"Using all available data: {len(df)} rows")
+            logger.info(f"Using all available data: {len(df)} rows")
             return df
         
         timestamp_col = self.column_mapping['timestamp']
         cutoff_date = datetime.now() - timedelta(days=days)
         
-        df_filtered = df[df[timestamp_col] >= cutoff_date].copy()
+        timestamps = df[timestamp_col]
+        
+        if timestamps.is_monotonic_increasing:
+            # Sorted data (as returned by clean_data) only needs a binary
+            # search for the first row on or after the cutoff
+            start = timestamps.searchsorted(cutoff_date, side='left')
+            df_filtered = df.iloc[start:]
+        else:
+            df_filtered = df[timestamps >= cutoff_date]
         
-        print(f"Filtered to last {days} days: {len(df_filtered)} rows")
+        logger.info(f"Filtered to last {days} days: {len(df_filtered)} rows")
         return df_filtered
     
+    def index_by_person(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Split data into per-person frames keyed by lowercase name
+        
+        Building this once lets repeated filter_by_person calls look up
+        each person directly instead of rescanning the name column.
+        
+        Args:
+            df: Cleaned DataFrame
+            
+        Returns:
+            Dict: Mapping of lowercase name to that person's rows
+        """
+        name_col = self.column_mapping['name']
+        
+        # Group on the name column itself (category codes after clean_data)
+        # and lowercase only the distinct names, not every row
+        person_index = {}
+        for name, df_person in df.groupby(name_col, observed=True, sort=False):
+            key = name.lower()
+            if key in person_index:
+                df_person = pd.concat([person_index[key], df_person])
+            person_index[key] = df_person
+        
+        return person_index
+    
     def filter_by_person(
         self,
         df: pd.DataFrame,
-        person_name: str
+        person_name: str,
+        person_index: Optional[Dict[str, pd.DataFrame]] = None
     ) -> pd.DataFrame:
         """
         Filter data for a specific person
@@ -132,23 +256,29 @@ class DataProcessor:
         Args:
             df: Cleaned DataFrame
             person_name: Name of the lead generator
+            person_index: Optional prebuilt index from index_by_person
             
         Returns:
             pd.DataFrame: Filtered DataFrame for the person
         """
         name_col = self.column_mapping['name']
+        # Case-insensitive pattern compiled once, so names are never
+        # lowercased just to be compared
+        pattern = re.compile(re.escape(person_name), re.IGNORECASE)
         
         # Try exact match first
-        df_person = df[df[name_col].str.lower() == person_name.lower()].copy()
+        if person_index is not None:
+            df_person = person_index.get(person_name.lower(), df.iloc[0:0])
+        else:
+            matches = [n for n in self._distinct_names(df) if pattern.fullmatch(n)]
+            df_person = df[df[name_col].isin(matches)]
         
-        # If no exact match, try partial match
+        # If no exact match, try partial match. Names are matched against
+        # the distinct names, then rows are selected by membership, so the
+        # substring search never runs per row
         if len(df_person) == 0:
-            df_person = df[
-                df[name_col].str.lower().str.contains(
-                    person_name.lower(),
-                    na=False
-                )
-            ].copy()
+            matches = [n for n in self._distinct_names(df) if pattern.search(n)]
+            df_person = df[df[name_col].isin(matches)]
         
         if len(df_person) == 0:
             available_names = df[name_col].unique()
@@ -157,9 +287,25 @@ class DataProcessor:
                 f"Available names: {', '.join(sorted(available_names))}"
             )
         
-        print(f"Found {len(df_person)} rows for {person_name}")
+        logger.info(f"Found {len(df_person)} rows for {person_name}")
         return df_person
     
+    def _distinct_names(self, df: pd.DataFrame) -> list:
+        """
+        Get the distinct lead generator names in the data
+        
+        Args:
+            df: Cleaned DataFrame
+            
+        Returns:
+            list: Distinct names (read from the categories when the name
+                column is categorical)
+        """
+        names = df[self.column_mapping['name']]
+        if isinstance(names.dtype, pd.CategoricalDtype):
+            return list(names.cat.categories)
+        return list(names.dropna().unique())
+    
     def get_team_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Get aggregated team data for comparison
@@ -172,13 +318,19 @@ class DataProcessor:
         """
         name_col = self.column_mapping['name']
         
-        # Aggregate by person
-        team_agg = df.groupby(name_col).agg({
-            self.column_mapping['doors_knocked']: 'sum',
-            self.column_mapping['homeowners_talked']: 'sum',
-            self.column_mapping['qualified_leads']: 'sum',
-            self.column_mapping['appointments_set']: 'sum'
-        }).reset_index()
+        metric_columns = [
+            self.column_mapping['doors_knocked'],
+            self.column_mapping['homeowners_talked'],
+            self.column_mapping['qualified_leads'],
+            self.column_mapping['appointments_set']
+        ]
+        
+        # Aggregate by person, summing the numeric block in one reduction
+        team_agg = (
+            df.groupby(name_col, observed=True, sort=False)[metric_columns]
+            .sum()
+            .reset_index()
+        )
         
         return team_agg
     
@@ -200,17 +352,21 @@ class DataProcessor:
         qualified_col = self.column_mapping['qualified_leads']
         appts_col = self.column_mapping['appointments_set']
         
-        # Homeowners talked shouldn't exceed doors knocked
-        if (df[talked_col] > df[doors_col]).any():
-            warnings.append("Some records have more homeowners talked than doors knocked")
-        
-        # Qualified leads shouldn't exceed homeowners talked
-        if (df[qualified_col] > df[talked_col]).any():
-            warnings.append("Some records have more qualified leads than homeowners talked")
+        # Stages are compared on the raw ndarray: talked vs doors,
+        # qualified vs talked, appointments vs qualified
+        funnel = df[[doors_col, talked_col, qualified_col, appts_col]].to_numpy(
+            dtype=np.float64
+        )
+        exceeds_previous = _stages_exceeding_previous(funnel)
         
-        # Appointments shouldn't exceed qualified leads
-        if (df[appts_col] > df[qualified_col]).any():
-            warnings.append("Some records have more appointments than qualified leads")
+        stage_warnings = [
+            "Some records have more homeowners talked than doors knocked",
+            "Some records have more qualified leads than homeowners talked",
+            "Some records have more appointments than qualified leads"
+        ]
+        for warning, flagged in zip(stage_warnings, exceeds_previous):
+            if flagged:
+                warnings.append(warning)
         
         return {
             'valid': len(warnings) == 0,
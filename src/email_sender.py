@@ -3,111 +3,108 @@ Email Sender Module
 Handles sending automated performance reports via email
 """
 
+import base64
+import functools
+import io
+import logging
+import mmap
+import os
 import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email import encoders, policy
+from email.utils import parseaddr
 from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.mime.nonmultipart import MIMENonMultipart
 from email.mime.image import MIMEImage
-from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
+from PIL import Image
 
+logger = logging.getLogger(__name__)
 
-class EmailSender:
-    """Handles email sending functionality"""
-    
-    def __init__(self, config: Dict):
-        """
-        Initialize email sender with configuration
-        
-        Args:
-            config: Email configuration dictionary
-        """
-        self.config = config
-        self.smtp_server = config.get('smtp_server', 'smtp.gmail.com')
-        self.smtp_port = config.get('smtp_port', 587)
-        self.use_tls = config.get('use_tls', True)
-        self.username = config.get('username')
-        self.password = config.get('password')
-        self.from_address = config.get('from_address', self.username)
-        
-    def create_html_body(
-        self,
-        person_name: str,
-        totals: Dict[str, float],
-        rates: Dict[str, float],
-        date_range: str
-    ) -> str:
-        """
-        Create HTML email body with summary statistics
-        
-        Args:
-            person_name: Name of the lead generator
-            totals: Dictionary of total metrics
-            rates: Dictionary of conversion rates
-            date_range: Date range string
-            
-        Returns:
-            HTML string for email body
-        """
-        html = f"""
+# Most concurrent connections opened by send_reports_bulk (Gmail allows
+# about 15 per account)
+MAX_CONNECTIONS = 15
+
+# Messages sent over one connection before it is replaced
+MAX_MESSAGES_PER_CONNECTION = 5000
+
+# Retries for temporary SMTP failures, waiting RETRY_DELAY seconds and
+# doubling the wait after each attempt
+MAX_SEND_RETRIES = 3
+RETRY_DELAY = 1.0
+
+# Reply codes for temporary failures (421 also closes the connection)
+TRANSIENT_SMTP_CODES = (421, 450, 451)
+
+
+# Static start of the HTML email body (document head and styles), which is
+# identical for every recipient
+_HTML_PREFIX = """
         <html>
         <head>
             <style>
-                body {{
+                body {
                     font-family: Arial, sans-serif;
                     line-height: 1.6;
                     color: #333;
-                }}
-                .header {{
+                }
+                .header {
                     background-color: #2E86AB;
                     color: white;
                     padding: 20px;
                     text-align: center;
                     border-radius: 5px;
-                }}
-                .content {{
+                }
+                .content {
                     padding: 20px;
-                }}
-                .metrics {{
+                }
+                .metrics {
                     background-color: #f4f4f4;
                     padding: 15px;
                     border-radius: 5px;
                     margin: 20px 0;
-                }}
-                .metric-row {{
+                }
+                .metric-row {
                     display: flex;
                     justify-content: space-between;
                     padding: 8px 0;
                     border-bottom: 1px solid #ddd;
-                }}
-                .metric-label {{
+                }
+                .metric-label {
                     font-weight: bold;
                     color: #555;
-                }}
-                .metric-value {{
+                }
+                .metric-value {
                     color: #2E86AB;
                     font-weight: bold;
-                }}
-                .conversion {{
+                }
+                .conversion {
                     background-color: #e8f4f8;
                     padding: 15px;
                     border-radius: 5px;
                     margin: 20px 0;
-                }}
-                .footer {{
+                }
+                .footer {
                     text-align: center;
                     padding: 20px;
                     color: #888;
                     font-size: 12px;
-                }}
-                .highlight {{
+                }
+                .highlight {
                     color: #06A77D;
                     font-weight: bold;
-                }}
+                }
             </style>
         </head>
         <body>
-            <div class="header">
+"""
+
+# Per-recipient part of the HTML email body, filled in by
+# EmailSender._render_html_content
+_HTML_CONTENT_TEMPLATE = """            <div class="header">
                 <h1>📊 Your Monthly Sales Performance</h1>
                 <p>{date_range}</p>
             </div>
@@ -119,43 +116,11 @@ class EmailSender:
                 
                 <div class="metrics">
                     <h2>📈 Your Activity Metrics</h2>
-                    <div class="metric-row">
-                        <span class="metric-label">Doors Knocked:</span>
-                        <span class="metric-value">{int(totals['doors_knocked'])}</span>
-                    </div>
-                    <div class="metric-row">
-                        <span class="metric-label">Homeowners Talked:</span>
-                        <span class="metric-value">{int(totals['homeowners_talked'])}</span>
-                    </div>
-                    <div class="metric-row">
-                        <span class="metric-label">Qualified Leads:</span>
-                        <span class="metric-value">{int(totals['qualified_leads'])}</span>
-                    </div>
-                    <div class="metric-row">
-                        <span class="metric-label">Appointments Set:</span>
-                        <span class="metric-value">{int(totals['appointments_set'])}</span>
-                    </div>
-                </div>
+{activity_rows}                </div>
                 
                 <div class="conversion">
                     <h2>🎯 Your Conversion Rates</h2>
-                    <div class="metric-row">
-                        <span class="metric-label">Talk Rate:</span>
-                        <span class="metric-value">{rates['talk_rate']:.1f}%</span>
-                    </div>
-                    <div class="metric-row">
-                        <span class="metric-label">Qualification Rate:</span>
-                        <span class="metric-value">{rates['qualification_rate']:.1f}%</span>
-                    </div>
-                    <div class="metric-row">
-                        <span class="metric-label">Appointment Rate:</span>
-                        <span class="metric-value">{rates['appointment_rate']:.1f}%</span>
-                    </div>
-                    <div class="metric-row">
-                        <span class="metric-label">Overall Conversion:</span>
-                        <span class="metric-value highlight">{rates['overall_conversion']:.1f}%</span>
-                    </div>
-                </div>
+{rate_rows}                </div>
                 
                 <p><strong>Attached Charts:</strong></p>
                 <ul>
@@ -174,12 +139,394 @@ class EmailSender:
             </div>
             
             <div class="footer">
-                <p>This is an automated report. Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+                <p>This is an automated report. Generated on {generated_at}</p>
             </div>
-        </body>
+"""
+
+# One label/value row in the metrics sections of the email body
+_METRIC_ROW_TEMPLATE = """                    <div class="metric-row">
+                        <span class="metric-label">{label}:</span>
+                        <span class="{value_class}">{value}</span>
+                    </div>
+"""
+
+# Rows of the activity section as (label, totals key)
+_ACTIVITY_ROWS = (
+    ('Doors Knocked', 'doors_knocked'),
+    ('Homeowners Talked', 'homeowners_talked'),
+    ('Qualified Leads', 'qualified_leads'),
+    ('Appointments Set', 'appointments_set'),
+)
+
+# Rows of the conversion section as (label, rates key, value CSS class)
+_RATE_ROWS = (
+    ('Talk Rate', 'talk_rate', 'metric-value'),
+    ('Qualification Rate', 'qualification_rate', 'metric-value'),
+    ('Appointment Rate', 'appointment_rate', 'metric-value'),
+    ('Overall Conversion', 'overall_conversion', 'metric-value highlight'),
+)
+
+# Static end of the HTML email body
+_HTML_SUFFIX = """        </body>
         </html>
         """
-        return html
+
+
+def _timestamp() -> str:
+    """Current time as shown in the email footer"""
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _serialize_7bit(msg: MIMEMultipart) -> bytes:
+    """
+    Serialize a message for servers without 8BITMIME, re-encoding its
+    8bit parts as quoted-printable
+    
+    Args:
+        msg: Message to serialize (its 8bit parts are re-encoded in place)
+        
+    Returns:
+        bytes: Message serialized with CRLF line endings
+    """
+    for part in msg.walk():
+        if part.get('Content-Transfer-Encoding') == '8bit':
+            del part['Content-Transfer-Encoding']
+            encoders.encode_quopri(part)
+    return msg.as_bytes(policy=policy.SMTP)
+
+
+def _sendmail(
+    server: smtplib.SMTP,
+    from_addr: str,
+    to_addrs: List[str],
+    data: bytes,
+    fallback: Callable[[], bytes]
+):
+    """
+    Send a serialized message with an 8bit body, declaring it to servers
+    that support 8BITMIME and sending a 7bit version to those that don't
+    
+    Args:
+        server: Connected server
+        from_addr: Envelope sender address
+        to_addrs: Envelope recipient addresses
+        data: Message serialized with CRLF line endings
+        fallback: Function returning the message serialized as 7bit
+    """
+    server.ehlo_or_helo_if_needed()
+    if server.has_extn('8bitmime'):
+        server.sendmail(from_addr, to_addrs, data, mail_options=['BODY=8BITMIME'])
+    else:
+        server.sendmail(from_addr, to_addrs, fallback())
+
+
+def _optimize_image(path: str, max_dimension: int) -> Optional[bytes]:
+    """
+    Scale a PNG or JPEG down to fit within max_dimension and re-compress
+    it in the same format
+    
+    Args:
+        path: Path to the image file
+        max_dimension: Largest width or height in pixels
+        
+    Returns:
+        bytes: Optimized image data, or None if the image already fits and
+            should be attached unchanged
+    """
+    with Image.open(path) as img:
+        # Only the header has been read so far, so images that already
+        # fit are never decoded
+        if max(img.size) <= max_dimension:
+            return None
+        
+        image_format = img.format
+        img.thumbnail((max_dimension, max_dimension))
+        buffer = io.BytesIO()
+        if image_format == 'JPEG':
+            img.save(buffer, 'JPEG', quality=85)
+        else:
+            img.save(buffer, 'PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def _encode_image_attachment(
+    path: str,
+    filename: str,
+    size: int,
+    max_dimension: Optional[int] = None
+) -> MIMEImage:
+    """
+    Build an already base64-encoded PNG or JPEG attachment
+    
+    Unless the image has to be scaled down, the file is memory-mapped and
+    encoded straight from the mapping. The part can be attached to any number of
+    messages without being encoded again, so it must not be modified.
+    
+    Args:
+        path: Path to the image file (.png, .jpg or .jpeg)
+        filename: Attachment file name
+        size: File size in bytes
+        max_dimension: Largest width or height in pixels; larger images
+            are scaled down and re-compressed, smaller ones are attached
+            as-is (None attaches every file as-is)
+        
+    Returns:
+        MIMEImage: Attachment part
+    """
+    optimized = None
+    if max_dimension and size > 0:
+        optimized = _optimize_image(path, max_dimension)
+    
+    if optimized is not None:
+        encoded = base64.encodebytes(optimized)
+    elif size == 0:
+        encoded = b''
+    else:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                encoded = base64.encodebytes(data)
+    
+    if path.lower().endswith(('.jpg', '.jpeg')):
+        subtype = 'jpeg'
+    else:
+        subtype = 'png'
+    
+    image = MIMEImage(
+        encoded, subtype, _encoder=encoders.encode_noop, name=filename
+    )
+    image['Content-Transfer-Encoding'] = 'base64'
+    return image
+
+
+class _SMTPSession:
+    """A reusable SMTP connection with reconnect and retry handling"""
+    
+    def __init__(self, connect: Callable[[], smtplib.SMTP]):
+        """
+        Initialize session (the connection is opened on first use)
+        
+        Args:
+            connect: Function returning a connected, logged in server
+        """
+        self._connect = connect
+        self._server = None
+        self._sent = 0
+    
+    def send(
+        self,
+        from_addr: str,
+        to_addrs: List[str],
+        data: bytes,
+        fallback: Callable[[], bytes]
+    ):
+        """
+        Send a serialized message, retrying temporary failures with backoff
+        
+        Args:
+            from_addr: Envelope sender address
+            to_addrs: Envelope recipient addresses
+            data: Message serialized with CRLF line endings
+            fallback: Function returning the message serialized as 7bit,
+                for servers without 8BITMIME
+        """
+        for attempt in range(MAX_SEND_RETRIES + 1):
+            try:
+                if self._server is None or self._sent >= MAX_MESSAGES_PER_CONNECTION:
+                    self.close()
+                    self._server = self._connect()
+                    self._sent = 0
+                
+                _sendmail(self._server, from_addr, to_addrs, data, fallback)
+                break
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException) as e:
+                code = getattr(e, 'smtp_code', None)
+                if attempt == MAX_SEND_RETRIES or (
+                    code is not None and code not in TRANSIENT_SMTP_CODES
+                ):
+                    raise
+                
+                if code is None or code == 421:
+                    self._discard()
+                else:
+                    self._reset()
+                time.sleep(RETRY_DELAY * 2 ** attempt)
+        
+        self._sent += 1
+        self._reset()
+    
+    def _reset(self):
+        """
+        Clear the transaction state before the next message. Some servers
+        close the connection here, so it is reopened on the next send.
+        """
+        try:
+            self._server.rset()
+        except smtplib.SMTPServerDisconnected:
+            self._discard()
+    
+    def _discard(self):
+        """Drop a connection the server has closed, releasing its socket"""
+        try:
+            self._server.close()
+        except Exception:
+            pass
+        self._server = None
+    
+    def close(self):
+        """Close the connection if one is open"""
+        if self._server is None:
+            return
+        
+        try:
+            self._server.quit()
+        except smtplib.SMTPException:
+            self._server.close()
+        finally:
+            self._server = None
+
+
+class EmailSender:
+    """Handles email sending functionality"""
+    
+    def __init__(self, config: Dict):
+        """
+        Initialize email sender with configuration
+        
+        Args:
+            config: Email configuration dictionary
+        """
+        self.config = config
+        self.smtp_server = config.get('smtp_server', 'smtp.gmail.com')
+        self.smtp_port = config.get('smtp_port', 587)
+        self.use_tls = config.get('use_tls', True)
+        self.username = config.get('username')
+        self.password = config.get('password')
+        self.from_address = config.get('from_address', self.username)
+        self.concurrency = min(config.get('concurrency', 4), MAX_CONNECTIONS)
+        self.max_image_size = config.get('max_image_size', 1200)
+        self._session = None
+        
+        # The static parts of the email body are encoded once and reused
+        self._html_prefix = _HTML_PREFIX.encode('utf-8')
+        self._html_suffix = _HTML_SUFFIX.encode('utf-8')
+    
+    def __enter__(self):
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _connect(self) -> smtplib.SMTP:
+        """
+        Open an SMTP connection, upgraded to TLS and logged in as configured
+        
+        Returns:
+            smtplib.SMTP: Connected server
+        """
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            if self.use_tls:
+                server.starttls()
+            
+            if self.username and self.password:
+                server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        
+        return server
+    
+    def open(self):
+        """
+        Open a connection that is reused by send_report until close()
+        
+        Without an open connection each send_report call connects and
+        logs in on its own.
+        """
+        if self._session is None:
+            self._session = _SMTPSession(self._connect)
+    
+    def close(self):
+        """Close the connection opened by open()"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
+    def create_html_body(
+        self,
+        person_name: str,
+        totals: Dict[str, float],
+        rates: Dict[str, float],
+        date_range: str,
+        generated_at: Optional[str] = None
+    ) -> str:
+        """
+        Create HTML email body with summary statistics
+        
+        Args:
+            person_name: Name of the lead generator
+            totals: Dictionary of total metrics
+            rates: Dictionary of conversion rates
+            date_range: Date range string
+            generated_at: Generation time shown in the footer (defaults
+                to now)
+            
+        Returns:
+            HTML string for email body
+        """
+        return (
+            _HTML_PREFIX
+            + self._render_html_content(
+                person_name, totals, rates, date_range, generated_at
+            )
+            + _HTML_SUFFIX
+        )
+    
+    def _render_html_content(
+        self,
+        person_name: str,
+        totals: Dict[str, float],
+        rates: Dict[str, float],
+        date_range: str,
+        generated_at: Optional[str] = None
+    ) -> str:
+        """
+        Render the per-recipient part of the HTML email body
+        
+        Args:
+            person_name: Name of the lead generator
+            totals: Dictionary of total metrics
+            rates: Dictionary of conversion rates
+            date_range: Date range string
+            generated_at: Generation time shown in the footer (defaults
+                to now)
+            
+        Returns:
+            HTML string placed between the static prefix and suffix
+        """
+        values = {
+            'person_name': person_name,
+            'date_range': date_range,
+            'generated_at': generated_at or _timestamp(),
+            'activity_rows': ''.join(
+                _METRIC_ROW_TEMPLATE.format(
+                    label=label,
+                    value_class='metric-value',
+                    value=int(totals[key])
+                )
+                for label, key in _ACTIVITY_ROWS
+            ),
+            'rate_rows': ''.join(
+                _METRIC_ROW_TEMPLATE.format(
+                    label=label,
+                    value_class=value_class,
+                    value=f"{rates[key]:.1f}%"
+                )
+                for label, key, value_class in _RATE_ROWS
+            )
+        }
+        return _HTML_CONTENT_TEMPLATE.format_map(values)
     
     def send_report(
         self,
@@ -188,7 +535,10 @@ class EmailSender:
         chart_paths: Dict[str, str],
         totals: Dict[str, float],
         rates: Dict[str, float],
-        date_range: str
+        date_range: str,
+        session: Optional[_SMTPSession] = None,
+        generated_at: Optional[str] = None,
+        prepared_charts: Optional[Dict[str, MIMEImage]] = None
     ) -> bool:
         """
         Send performance report email with chart attachments
@@ -200,6 +550,12 @@ class EmailSender:
             totals: Dictionary of total metrics
             rates: Dictionary of conversion rates
             date_range: Date range string
+            session: Connection to send over (defaults to the one opened
+                by open(), if any)
+            generated_at: Generation time shown in the footer (defaults
+                to now)
+            prepared_charts: Attachments from prepare_charts, used instead
+                of reading chart_paths
             
         Returns:
             bool: True if email sent successfully, False otherwise
@@ -211,33 +567,159 @@ class EmailSender:
             msg['To'] = to_email
             msg['Subject'] = f"Your Monthly Sales Performance - {date_range}"
             
-            # Create HTML body
-            html_body = self.create_html_body(person_name, totals, rates, date_range)
-            msg.attach(MIMEText(html_body, 'html'))
+            # Create HTML body. Only the per-recipient part is encoded here,
+            # and the body is sent as 8bit so it needs no further encoding
+            # (servers without 8BITMIME get a quoted-printable copy)
+            html_content = self._render_html_content(
+                person_name, totals, rates, date_range, generated_at
+            )
+            html_part = MIMENonMultipart('text', 'html', charset='utf-8')
+            html_part['Content-Transfer-Encoding'] = '8bit'
+            html_part.set_payload(
+                self._html_prefix
+                + html_content.encode('utf-8')
+                + self._html_suffix
+            )
+            msg.attach(html_part)
             
             # Attach charts
-            for chart_name, chart_path in chart_paths.items():
-                if Path(chart_path).exists():
-                    with open(chart_path, 'rb') as f:
-                        img_data = f.read()
-                        image = MIMEImage(img_data, name=f"{chart_name}.png")
-                        msg.attach(image)
+            if prepared_charts is None:
+                prepared_charts = self.prepare_charts(chart_paths)
+            for image in prepared_charts.values():
+                msg.attach(image)
+            
+            # Serialize once in wire format, so retries resend the same
+            # bytes instead of regenerating the message
+            data = msg.as_bytes(policy=policy.SMTP)
+            fallback = functools.partial(_serialize_7bit, msg)
+            from_addr = parseaddr(self.from_address)[1]
             
             # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls()
-                
-                if self.username and self.password:
-                    server.login(self.username, self.password)
-                
-                server.send_message(msg)
+            session = session or self._session
+            if session is None:
+                with self._connect() as server:
+                    _sendmail(server, from_addr, [to_email], data, fallback)
+            else:
+                session.send(from_addr, [to_email], data, fallback)
             
             return True
         except Exception as e:
-            print(f"Failed to send email to {to_email}: {str(e)}")
+            logger.error(f"Failed to send email to {to_email}: {str(e)}")
             return False
     
+    def prepare_charts(self, chart_paths: Dict[str, str]) -> Dict[str, MIMEImage]:
+        """
+        Check and encode chart files once, ready to attach to any number
+        of emails without further file access
+        
+        Args:
+            chart_paths: Dictionary mapping chart names to file paths
+            
+        Returns:
+            Dict: Chart names mapped to attachment parts (missing files
+                are left out)
+        """
+        prepared = {}
+        for chart_name, chart_path in chart_paths.items():
+            image = self._chart_attachment(chart_name, chart_path)
+            if image is not None:
+                prepared[chart_name] = image
+        
+        return prepared
+    
+    def _chart_attachment(
+        self,
+        chart_name: str,
+        chart_path: str
+    ) -> Optional[MIMEImage]:
+        """
+        Encode a chart file as an attachment
+        
+        Args:
+            chart_name: Name of the chart
+            chart_path: Path to the chart image
+            
+        Returns:
+            MIMEImage: Attachment part, or None if the file is missing
+        """
+        try:
+            size = os.stat(chart_path).st_size
+        except FileNotFoundError:
+            logger.warning(f"Chart not found, not attaching it: {chart_path}")
+            return None
+        
+        chart_path = str(chart_path)
+        extension = os.path.splitext(chart_path)[1]
+        return _encode_image_attachment(
+            chart_path, f"{chart_name}{extension}", size, self.max_image_size
+        )
+    
+    def send_reports_bulk(
+        self,
+        jobs: List[Dict],
+        concurrency: Optional[int] = None
+    ) -> List[bool]:
+        """
+        Send several reports concurrently
+        
+        Each worker thread keeps its own connection open for all the
+        reports it sends. Every distinct chart in the batch is checked
+        and encoded once up front and shared by the emails that attach it,
+        so sending does no file access.
+        
+        Args:
+            jobs: Keyword arguments for send_report, one dict per email
+            concurrency: Number of simultaneous connections (defaults to
+                the configured value, capped at MAX_CONNECTIONS)
+            
+        Returns:
+            List[bool]: Whether each email was sent, in job order
+        """
+        if concurrency is None:
+            concurrency = self.concurrency
+        workers = max(1, min(concurrency, MAX_CONNECTIONS, len(jobs)))
+        
+        # Every email in the batch shows the same generation time
+        generated_at = _timestamp()
+        local = threading.local()
+        sessions = []
+        lock = threading.Lock()
+        
+        def send(job: Dict) -> bool:
+            if not hasattr(local, 'session'):
+                local.session = _SMTPSession(self._connect)
+                with lock:
+                    sessions.append(local.session)
+            return self.send_report(
+                **job, session=local.session, generated_at=generated_at
+            )
+        
+        charts = list({
+            (chart_name, chart_path)
+            for job in jobs
+            for chart_name, chart_path in job['chart_paths'].items()
+        })
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                images = pool.map(
+                    lambda chart: self._chart_attachment(*chart), charts
+                )
+                attachments = dict(zip(charts, images))
+                
+                jobs = [
+                    {**job, 'prepared_charts': {
+                        chart_name: attachments[(chart_name, chart_path)]
+                        for chart_name, chart_path in job['chart_paths'].items()
+                        if attachments[(chart_name, chart_path)] is not None
+                    }}
+                    for job in jobs
+                ]
+                return list(pool.map(send, jobs))
+        finally:
+            for session in sessions:
+                session.close()
+    
     def test_connection(self) -> bool:
         """
         Test SMTP connection
@@ -246,16 +728,12 @@ class EmailSender:
             bool: True if connection successful, False otherwise
         """
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls()
-                
-                if self.username and self.password:
-                    server.login(self.username, self.password)
+            with self._connect():
+                pass
             
-            print("SMTP connection test successful")
+            logger.info("SMTP connection test successful")
             return True
         except Exception as e:
-            print(f"SMTP connection test failed: {str(e)}")
+            logger.error(f"SMTP connection test failed: {str(e)}")
             return False
 
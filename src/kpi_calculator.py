@@ -3,9 +3,10 @@ KPI Calculator Module
 Calculates key performance indicators and metrics
 """
 
+import operator
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 
 
@@ -20,6 +21,61 @@ class KPICalculator:
             column_mapping: Dictionary mapping config keys to column names
         """
         self.column_mapping = column_mapping
+        
+        # Column names are resolved once rather than on every call
+        self._timestamp_col = column_mapping['timestamp']
+        
+        # Activity metrics in funnel order, and their column names
+        self._total_keys = (
+            'doors_knocked',
+            'homeowners_talked',
+            'qualified_leads',
+            'appointments_set'
+        )
+        self._total_cols = [column_mapping[key] for key in self._total_keys]
+        self._get_totals = operator.itemgetter(*self._total_keys)
+        
+        # Conversion rates, each dividing a funnel stage by an earlier one
+        # (positions in _total_keys):
+        #   talk rate: homeowners talked / doors knocked
+        #   qualification rate: qualified leads / homeowners talked
+        #   appointment rate: appointments / qualified leads
+        #   overall conversion: appointments / doors knocked
+        self._rate_keys = (
+            'talk_rate',
+            'qualification_rate',
+            'appointment_rate',
+            'overall_conversion'
+        )
+        self._rate_numerators = np.array([1, 2, 3, 3])
+        self._rate_denominators = np.array([0, 1, 2, 0])
+        
+        # Team DataFrame and its averages from the last comparison
+        self._team_averages_cache = None
+    
+    def __getstate__(self):
+        # The cached team data is not worth shipping to worker processes
+        state = self.__dict__.copy()
+        state['_team_averages_cache'] = None
+        return state
+    
+    def prepare(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Index data by its timestamps for repeated KPI calculations
+        
+        Call once on the cleaned data before splitting it per person. The
+        calculations then read dates from the index instead of going
+        through the timestamp column's .dt accessor on every call.
+        Unprepared data is still accepted.
+        
+        Args:
+            df: Cleaned DataFrame
+            
+        Returns:
+            pd.DataFrame: The data indexed by timestamp (the timestamp
+                column is kept)
+        """
+        return df.set_axis(pd.DatetimeIndex(df[self._timestamp_col]))
     
     def calculate_totals(self, df: pd.DataFrame) -> Dict[str, float]:
         """
@@ -31,14 +87,10 @@ class KPICalculator:
         Returns:
             Dict: Total metrics
         """
-        totals = {
-            'doors_knocked': df[self.column_mapping['doors_knocked']].sum(),
-            'homeowners_talked': df[self.column_mapping['homeowners_talked']].sum(),
-            'qualified_leads': df[self.column_mapping['qualified_leads']].sum(),
-            'appointments_set': df[self.column_mapping['appointments_set']].sum()
-        }
+        # One reduction over the metric block instead of one per column
+        sums = df[self._total_cols].to_numpy().sum(axis=0)
         
-        return totals
+        return dict(zip(self._total_keys, sums.tolist()))
     
     def calculate_conversion_rates(self, totals: Dict[str, float]) -> Dict[str, float]:
         """
@@ -50,70 +102,85 @@ class KPICalculator:
         Returns:
             Dict: Conversion rates (as percentages)
         """
-        rates = {}
-        
-        # Talk rate: homeowners talked / doors knocked
-        if totals['doors_knocked'] > 0:
-            rates['talk_rate'] = (
-                totals['homeowners_talked'] / totals['doors_knocked'] * 100
-            )
-        else:
-            rates['talk_rate'] = 0.0
-        
-        # Qualification rate: qualified leads / homeowners talked
-        if totals['homeowners_talked'] > 0:
-            rates['qualification_rate'] = (
-                totals['qualified_leads'] / totals['homeowners_talked'] * 100
-            )
-        else:
-            rates['qualification_rate'] = 0.0
-        
-        # Appointment rate: appointments / qualified leads
-        if totals['qualified_leads'] > 0:
-            rates['appointment_rate'] = (
-                totals['appointments_set'] / totals['qualified_leads'] * 100
-            )
-        else:
-            rates['appointment_rate'] = 0.0
-        
-        # Overall conversion: appointments / doors knocked
-        if totals['doors_knocked'] > 0:
-            rates['overall_conversion'] = (
-                totals['appointments_set'] / totals['doors_knocked'] * 100
-            )
-        else:
-            rates['overall_conversion'] = 0.0
-        
-        return rates
+        stages = np.array(self._get_totals(totals), dtype=np.float64)
+        rates = self._rates_from_stages(stages)
+        
+        return dict(zip(self._rate_keys, rates.tolist()))
     
-    def calculate_daily_trends(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _rates_from_stages(self, stages: np.ndarray) -> np.ndarray:
         """
-        Calculate daily aggregated metrics
+        Calculate conversion rates from funnel stage totals
         
         Args:
-            df: DataFrame with individual's data
+            stages: Totals in _total_keys order along the last axis (one
+                row per person for a 2D array)
             
         Returns:
-            pd.DataFrame: Daily aggregated metrics
+            np.ndarray: Rates in _rate_keys order along the last axis
+        """
+        numerators = stages[..., self._rate_numerators]
+        denominators = stages[..., self._rate_denominators]
+        
+        # Rates with an empty earlier stage are 0
+        return np.divide(
+            numerators, denominators,
+            out=np.zeros(numerators.shape),
+            where=denominators > 0
+        ) * 100
+    
+    def calculate_all_totals(self, df: pd.DataFrame, by) -> pd.DataFrame:
         """
-        timestamp_col = self.column_mapping['timestamp']
+        Calculate total metrics and conversion rates for every person at once
         
-        # Create date column (without time)
-        df_copy = df.copy()
-        df_copy['date'] = df_copy[timestamp_col].dt.date
+        One groupby replaces filtering and summing each person's rows
+        separately.
         
-        # Aggregate by date
-        daily_agg = df_copy.groupby('date').agg({
-            self.column_mapping['doors_knocked']: 'sum',
-            self.column_mapping['homeowners_talked']: 'sum',
-            self.column_mapping['qualified_leads']: 'sum',
-            self.column_mapping['appointments_set']: 'sum'
-        }).reset_index()
+        Args:
+            df: Cleaned DataFrame with everyone's data
+            by: Name column, or a Series of per-row keys, to group by
+            
+        Returns:
+            pd.DataFrame: One row per person, with the calculate_totals and
+                calculate_conversion_rates keys as columns
+        """
+        sums = df.groupby(by, observed=True, sort=False)[self._total_cols].sum()
+        stages = sums.to_numpy()
         
-        # Sort by date
-        daily_agg = daily_agg.sort_values('date')
+        all_totals = pd.DataFrame(
+            stages, index=sums.index, columns=list(self._total_keys)
+        )
+        all_totals[list(self._rate_keys)] = self._rates_from_stages(
+            stages.astype(np.float64)
+        )
         
-        return daily_agg
+        return all_totals
+    
+    def split_kpis(self, row: pd.Series) -> Tuple[Dict[str, int], Dict[str, float]]:
+        """
+        Split one person's row from calculate_all_totals into the dicts
+        returned by calculate_totals and calculate_conversion_rates
+        
+        Args:
+            row: Row of calculate_all_totals output
+            
+        Returns:
+            Tuple: Total metrics and conversion rates
+        """
+        totals = {key: int(row[key]) for key in self._total_keys}
+        rates = {key: float(row[key]) for key in self._rate_keys}
+        return totals, rates
+    
+    def calculate_daily_trends(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculate daily aggregated metrics
+        
+        Args:
+            df: DataFrame with individual's data
+            
+        Returns:
+            pd.DataFrame: Daily aggregated metrics
+        """
+        return self._daily_table(self._sum_by_day(df))
     
     def calculate_weekly_trends(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -125,29 +192,80 @@ class KPICalculator:
         Returns:
             pd.DataFrame: Weekly aggregated metrics
         """
-        timestamp_col = self.column_mapping['timestamp']
+        # Group by the week directly rather than adding a column to a copy
+        weeks = self._timestamps(df).to_period('W')
+        weekly = df.groupby(weeks)[self._total_cols].sum()
         
-        # Create week column
-        df_copy = df.copy()
-        df_copy['week'] = df_copy[timestamp_col].dt.to_period('W')
+        return self._weekly_table(weekly)
+    
+    def calculate_trends(
+        self,
+        df: pd.DataFrame
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Calculate daily and weekly aggregated metrics in one pass
         
-        # Aggregate by week
-        weekly_agg = df_copy.groupby('week').agg({
-            self.column_mapping['doors_knocked']: 'sum',
-            self.column_mapping['homeowners_talked']: 'sum',
-            self.column_mapping['qualified_leads']: 'sum',
-            self.column_mapping['appointments_set']: 'sum'
-        }).reset_index()
+        Rows are grouped by day once and the weekly totals are summed from
+        the daily ones, so callers needing both avoid a second pass over
+        the data.
         
-        # Convert week period to string for display
-        weekly_agg['week'] = weekly_agg['week'].astype(str)
+        Args:
+            df: DataFrame with individual's data
+            
+        Returns:
+            Tuple: Daily and weekly aggregated metrics, as returned by
+                calculate_daily_trends and calculate_weekly_trends
+        """
+        daily = self._sum_by_day(df)
+        weekly = daily.groupby(daily.index.to_period('W')).sum()
         
-        return weekly_agg
+        return self._daily_table(daily), self._weekly_table(weekly)
+    
+    def _sum_by_day(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Sum the metrics per day, grouping by the timestamps' dates directly
+        rather than adding a date column to a copy of the data
+        
+        Args:
+            df: DataFrame with individual's data
+            
+        Returns:
+            pd.DataFrame: Daily totals indexed by day
+        """
+        # Day keys as numpy datetime64 values hash in C, unlike date objects
+        days = self._timestamps(df).to_numpy().astype('datetime64[D]')
+        return df.groupby(days)[self._total_cols].sum()
+    
+    def _timestamps(self, df: pd.DataFrame) -> pd.DatetimeIndex:
+        """
+        Get the entry timestamps, from the index if prepare() set it
+        
+        Args:
+            df: DataFrame with individual's data
+            
+        Returns:
+            pd.DatetimeIndex: Entry timestamps
+        """
+        if isinstance(df.index, pd.DatetimeIndex):
+            return df.index
+        return pd.DatetimeIndex(df[self._timestamp_col])
+    
+    def _daily_table(self, daily: pd.DataFrame) -> pd.DataFrame:
+        """Turn daily totals into a table with a datetime64 'date' column"""
+        return daily.rename_axis('date').reset_index()
+    
+    def _weekly_table(self, weekly: pd.DataFrame) -> pd.DataFrame:
+        """Turn weekly totals into a table with a 'week' column of labels"""
+        # Label the weeks for display while they are still a PeriodIndex,
+        # rather than boxing them into a column of Period objects first
+        labels = weekly.index.astype(str).rename('week')
+        return weekly.set_axis(labels).reset_index()
     
     def calculate_team_comparison(
         self,
         individual_totals: Dict[str, float],
-        team_df: pd.DataFrame
+        team_df: pd.DataFrame,
+        team_averages: Optional[Dict[str, float]] = None
     ) -> Dict[str, Dict[str, float]]:
         """
         Compare individual performance to team averages
@@ -155,22 +273,18 @@ class KPICalculator:
         Args:
             individual_totals: Individual's total metrics
             team_df: DataFrame with all team members' aggregated data
+            team_averages: Averages from precompute_team_averages (computed
+                from team_df if not given)
             
         Returns:
             Dict: Comparison metrics
         """
-        # Calculate team averages
-        team_averages = {
-            'doors_knocked': team_df[self.column_mapping['doors_knocked']].mean(),
-            'homeowners_talked': team_df[self.column_mapping['homeowners_talked']].mean(),
-            'qualified_leads': team_df[self.column_mapping['qualified_leads']].mean(),
-            'appointments_set': team_df[self.column_mapping['appointments_set']].mean()
-        }
+        if team_averages is None:
+            team_averages = self.precompute_team_averages(team_df)
         
         # Calculate differences
         comparison = {}
-        for metric in individual_totals.keys():
-            individual_val = individual_totals[metric]
+        for metric, individual_val in individual_totals.items():
             team_avg = team_averages[metric]
             
             if team_avg > 0:
@@ -186,6 +300,29 @@ class KPICalculator:
         
         return comparison
     
+    def precompute_team_averages(self, team_df: pd.DataFrame) -> Dict[str, float]:
+        """
+        Calculate team average metrics
+        
+        The result for the most recent team DataFrame is kept, so comparing
+        every member against the same team data averages it only once.
+        
+        Args:
+            team_df: DataFrame with all team members' aggregated data
+            
+        Returns:
+            Dict: Team average metrics
+        """
+        cache = self._team_averages_cache
+        if cache is not None and cache[0] is team_df:
+            return cache[1]
+        
+        means = team_df[self._total_cols].mean()
+        team_averages = dict(zip(self._total_keys, means.tolist()))
+        self._team_averages_cache = (team_df, team_averages)
+        
+        return team_averages
+    
     def get_summary_stats(self, df: pd.DataFrame) -> Dict:
         """
         Get summary statistics for the data
@@ -196,15 +333,18 @@ class KPICalculator:
         Returns:
             Dict: Summary statistics
         """
-        timestamp_col = self.column_mapping['timestamp']
+        timestamps = self._timestamps(df)
+        
+        # Count distinct days on numpy day values, not Python date objects
+        days = timestamps.to_numpy().astype('datetime64[D]')
         
         stats = {
             'total_entries': len(df),
             'date_range': {
-                'start': df[timestamp_col].min().strftime('%Y-%m-%d'),
-                'end': df[timestamp_col].max().strftime('%Y-%m-%d')
+                'start': timestamps.min().strftime('%Y-%m-%d'),
+                'end': timestamps.max().strftime('%Y-%m-%d')
             },
-            'days_active': df[timestamp_col].dt.date.nunique()
+            'days_active': np.unique(days).size
         }
         
         return stats
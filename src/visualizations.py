@@ -3,15 +3,180 @@ Visualization Module
 Generates charts and graphs for KPI display
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import seaborn as sns
+import functools
+import hashlib
+import io
+import json
+import logging
+import math
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
 import pandas as pd
 import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 from typing import Dict, Tuple, Optional
 from pathlib import Path
 import os
 
+logger = logging.getLogger(__name__)
+
+# The four activity metrics, in funnel order, with their display names,
+# chart labels and the color scheme entry each is drawn in
+METRIC_KEYS = ('doors_knocked', 'homeowners_talked', 'qualified_leads', 'appointments_set')
+METRIC_NAMES = ('Doors Knocked', 'Homeowners Talked', 'Qualified Leads', 'Appointments Set')
+METRIC_LABELS = ('Doors\nKnocked', 'Homeowners\nTalked', 'Qualified\nLeads', 'Appointments\nSet')
+METRIC_COLOR_ROLES = ('primary', 'warning', 'success', 'secondary')
+
+# Conversion rates, with their chart labels. The first three are the
+# stage-to-stage rates shown in the funnel.
+RATE_KEYS = ('talk_rate', 'qualification_rate', 'appointment_rate', 'overall_conversion')
+RATE_LABELS = ('Talk\nRate', 'Qualification\nRate', 'Appointment\nRate', 'Overall\nConversion')
+
+# Supported chart file formats, and the Pillow options each is saved with.
+# JPEG is lossy but encodes several times faster than PNG.
+OUTPUT_FORMATS = ('png', 'jpg')
+JPEG_OPTIONS = {'quality': 85, 'optimize': False, 'progressive': False}
+
+# Fonts of chart titles and axis labels, shared by every chart
+TITLE_FONT = {'fontsize': 18, 'fontweight': 'bold'}
+AXIS_LABEL_FONT = {'fontsize': 14, 'fontweight': 'bold'}
+
+# Text and axis colors of charts drawn with Pillow in fast mode
+FAST_TEXT_COLOR = (38, 38, 38)
+FAST_AXIS_COLOR = (204, 204, 204)
+FAST_GRID_COLOR = (235, 235, 235)
+
+# Part of every chart input hash; bump it when the chart drawing changes so
+# previously rendered charts are not reused
+CHART_CACHE_VERSION = 1
+
+# Maps ASCII characters not allowed in directory names to '_'
+_UNSAFE_ASCII = str.maketrans({
+    c: '_' for c in map(chr, range(128)) if not (c.isalnum() or c in ' _')
+})
+
+# Same rule for any Unicode name (\w is alphanumerics and '_')
+_UNSAFE_CHARS = re.compile(r'[^\w ]')
+
+# pyplot, loaded by _get_pyplot() when the first chart is drawn
+_pyplot = None
+
+
+def _get_pyplot():
+    """
+    Import pyplot and apply the chart style on first use
+    
+    matplotlib and seaborn take around a second to import, so they are
+    only loaded once a chart is actually drawn.
+    
+    Returns:
+        module: matplotlib.pyplot
+    """
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+        # Charts are only ever written to files, so use the non-interactive
+        # Agg backend rather than letting pyplot load a GUI toolkit
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        # Set seaborn style
+        sns.set_style("whitegrid")
+        sns.set_palette("husl")
+        
+        # Resolve the chart fonts once up front; matplotlib caches the
+        # lookups, so the first chart doesn't pay for the font search
+        from matplotlib.font_manager import FontProperties, findfont
+        for weight in ('normal', 'bold'):
+            findfont(FontProperties(weight=weight))
+        
+        _pyplot = plt
+    return _pyplot
+
+
+# ChartGenerator used by a chart worker process, set by _init_chart_worker()
+_worker_generator = None
+
+
+def _init_chart_worker(generator: 'ChartGenerator'):
+    """Store a copy of the chart generator in a worker process"""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _render_chart_in_worker(method_name: str, args: tuple) -> str:
+    """Call one of the generate_* methods on the worker's generator"""
+    return getattr(_worker_generator, method_name)(*args)
+
+
+def _hash_chart_inputs(*values) -> str:
+    """
+    Hash the inputs a chart is rendered from
+    
+    BLAKE2 is used as a fast, dependency-free hash; the digest only
+    detects changed inputs and is not security-sensitive.
+    
+    Args:
+        *values: JSON-serializable values or DataFrames
+        
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        if isinstance(value, pd.DataFrame):
+            digest.update(json.dumps(list(value.columns), default=str).encode('utf-8'))
+            digest.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+        else:
+            digest.update(json.dumps(value, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _pil_font(size: int) -> ImageFont.FreeTypeFont:
+    """Load Pillow's default font at a pixel size, once per size"""
+    return ImageFont.load_default(size=size)
+
+
+def _tick_step(span: float, max_ticks: int = 6) -> float:
+    """
+    Pick a round axis tick spacing
+    
+    Args:
+        span: Axis range from 0
+        max_ticks: Most ticks to show
+        
+    Returns:
+        float: Spacing of 1, 2, 2.5 or 5 times a power of ten
+    """
+    magnitude = 10 ** math.floor(math.log10(span / max_ticks))
+    for factor in (1, 2, 2.5, 5):
+        if span / (factor * magnitude) <= max_ticks:
+            return factor * magnitude
+    return 10 * magnitude
+
+
+class _ChartTemplate:
+    """A drawn chart kept so later reports only need to update its data"""
+    
+    def __init__(self, fig, ax, bars: list, labels: list, rate_labels: list = None):
+        """
+        Args:
+            fig: Figure the chart is drawn on
+            ax: Axes the chart is drawn on
+            bars: Bar artists, in drawing order
+            labels: Value label artists, one per bar
+            rate_labels: Conversion rate label artists (funnel only)
+        """
+        self.fig = fig
+        self.ax = ax
+        self.bars = bars
+        self.labels = labels
+        self.rate_labels = rate_labels or []
+
 
 class ChartGenerator:
     """Generates visualization charts for KPIs"""
@@ -19,22 +184,51 @@ class ChartGenerator:
     def __init__(
         self,
         output_dir: str,
-        dpi: int = 300,
+        dpi: int = 100,
         figure_size: Tuple[int, int] = (12, 8),
-        colors: Dict[str, str] = None
+        colors: Dict[str, str] = None,
+        png_compress_level: int = 1,
+        workers: int = 0,
+        output_format: str = 'png',
+        fast_mode: bool = False
     ):
         """
         Initialize chart generator
         
         Args:
             output_dir: Directory to save charts
-            dpi: Resolution for saved charts
+            dpi: Resolution for saved charts. Rendering and PNG encoding
+                cost grow with the pixel count, so the default of 100 is
+                sized for screen and email; pass a higher value (e.g. the
+                configured export_dpi) for print-quality output
             figure_size: Figure size in inches (width, height)
             colors: Color scheme dictionary
+            png_compress_level: zlib level for saved PNGs (0-9); low levels
+                encode much faster for slightly larger files
+            workers: Number of processes generate_all_charts renders the
+                charts in (0 renders them one after another in this
+                process). Leave at 0 when reports are already generated
+                in parallel.
+            output_format: Chart file format, 'png' or 'jpg'. JPEG files
+                encode faster and are smaller but lossy, and have no
+                transparency; use PNG for archival charts.
+            fast_mode: Draw the KPI and conversion rate bar charts
+                directly with Pillow instead of matplotlib. They render in
+                milliseconds but are plainer than the matplotlib charts.
         """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unsupported chart format '{output_format}', "
+                f"expected one of: {', '.join(OUTPUT_FORMATS)}"
+            )
+        
         self.output_dir = output_dir
         self.dpi = dpi
         self.figure_size = figure_size
+        self.png_compress_level = png_compress_level
+        self.workers = workers
+        self.output_format = output_format
+        self.fast_mode = fast_mode
         
         # Default color scheme
         self.colors = colors or {
@@ -45,13 +239,356 @@ class ChartGenerator:
             'danger': '#C73E1D'
         }
         
-        # Set seaborn style
-        sns.set_style("whitegrid")
-        sns.set_palette("husl")
+        # Colors of the four metric bars, aligned with METRIC_KEYS
+        self._metric_colors = [self.colors[role] for role in METRIC_COLOR_ROLES]
+        
+        # One Figure/Axes pair is created on first use and reused by every
+        # chart instead of building and tearing down a Figure per chart
+        self._fig = None
+        self._ax = None
+        
+        # Bar charts are drawn once and then updated in place for later
+        # reports, keyed by chart name
+        self._templates = {}
+        
+        # Output directories are dated by the day the generator was
+        # created, and each is created once, keyed by person name
+        self._today = date.today().isoformat()
+        self._output_dirs = {}
+        
+        # Chart worker processes, started on first use
+        self._pool = None
     
-    def _ensure_output_dir(self, person_name: str) -> Path:
+    def __getstate__(self) -> dict:
+        """Exclude the reusable Figures when pickling (e.g. for worker processes)"""
+        state = self.__dict__.copy()
+        state['_fig'] = None
+        state['_ax'] = None
+        state['_templates'] = {}
+        state['_pool'] = None
+        return state
+    
+    def close(self):
+        """Release the shared and template Figures and any chart workers"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        
+        plt = _get_pyplot()
+        if self._fig is not None:
+            plt.close(self._fig)
+            self._fig = None
+            self._ax = None
+        
+        for template in self._templates.values():
+            plt.close(template.fig)
+        self._templates.clear()
+    
+    def _get_axes(self):
         """
-        Create output directory for person if it doesn't exist
+        Get the shared Figure and Axes, cleared for a new chart
+        
+        Returns:
+            tuple: (Figure, Axes)
+        """
+        if self._fig is None:
+            self._fig, self._ax = _get_pyplot().subplots(
+                figsize=self.figure_size, layout='constrained'
+            )
+        
+        # clear() keeps tick parameters and spine visibility, so reset
+        # those too
+        self._ax.clear()
+        self._ax.tick_params(axis='both', which='both', reset=True)
+        for spine in self._ax.spines.values():
+            spine.set_visible(True)
+        
+        return self._fig, self._ax
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """
+        Get the chart worker pool, starting it on first use
+        
+        Each worker holds its own copy of this generator, so chart
+        templates are reused across reports within a worker too.
+        
+        Returns:
+            ProcessPoolExecutor: Pool of self.workers processes
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_chart_worker,
+                initargs=(self,)
+            )
+        return self._pool
+    
+    def _new_template(self, draw, *args) -> _ChartTemplate:
+        """
+        Draw a chart on a Figure of its own, to be updated by later calls
+        
+        Args:
+            draw: One of the _draw_* methods returning its bars and labels
+            *args: Arguments for draw after the Axes
+            
+        Returns:
+            _ChartTemplate: The drawn chart
+        """
+        fig, ax = _get_pyplot().subplots(
+            figsize=self.figure_size, layout='constrained'
+        )
+        return _ChartTemplate(fig, ax, *draw(ax, *args))
+    
+    def _set_title(self, ax, title: str, person_name: str, date_range: str):
+        """
+        Set a chart title with the person and date range
+        
+        Args:
+            ax: Axes to title
+            title: Chart title
+            person_name: Name of lead generator
+            date_range: Date range string
+        """
+        ax.set_title(f'{title} - {person_name}\n{date_range}', 
+                    fontdict=TITLE_FONT, pad=20)
+    
+    def _metric_values(self, totals: Dict[str, float]) -> np.ndarray:
+        """
+        Get the four metric totals as an array
+        
+        Args:
+            totals: Dictionary with total metrics
+            
+        Returns:
+            np.ndarray: Totals in METRIC_KEYS order
+        """
+        return np.fromiter(
+            (totals[key] for key in METRIC_KEYS), dtype=np.float64, count=len(METRIC_KEYS)
+        )
+    
+    def _rate_values(self, rates: Dict[str, float]) -> np.ndarray:
+        """
+        Get the four conversion rates as an array
+        
+        Args:
+            rates: Dictionary with conversion rates
+            
+        Returns:
+            np.ndarray: Rates in RATE_KEYS order
+        """
+        return np.fromiter(
+            (rates[key] for key in RATE_KEYS), dtype=np.float64, count=len(RATE_KEYS)
+        )
+    
+    def _funnel_widths(self, values: np.ndarray) -> np.ndarray:
+        """
+        Normalize funnel stage totals to the first stage
+        
+        Args:
+            values: Totals in METRIC_KEYS order
+            
+        Returns:
+            np.ndarray: Bar widths, all 0 when nothing was recorded
+        """
+        if values[0] > 0:
+            return values / values[0]
+        return np.zeros_like(values)
+    
+    def _comparison_values(self, comparison: Dict[str, Dict[str, float]]) -> np.ndarray:
+        """
+        Get individual and team average values as a 2-row array
+        
+        Args:
+            comparison: Comparison metrics dictionary
+            
+        Returns:
+            np.ndarray: Row 0 holds the individual values and row 1 the
+                team averages, in METRIC_KEYS order
+        """
+        values = np.empty((2, len(METRIC_KEYS)))
+        for i, key in enumerate(METRIC_KEYS):
+            metric = comparison[key]
+            values[0, i] = metric['individual']
+            values[1, i] = metric['team_average']
+        return values
+    
+    def _update_bar_labels(self, template: _ChartTemplate, values, label_format):
+        """
+        Set new heights on a template's vertical bars and move their labels
+        
+        Args:
+            template: Chart to update
+            values: New bar heights
+            label_format: Function formatting a height as its label
+        """
+        for bar, label, value in zip(template.bars, template.labels, values):
+            bar.set_height(value)
+            label.set_position((bar.get_x() + bar.get_width()/2., value))
+            label.set_text(label_format(value))
+    
+    def _figure_bytes(self, fig) -> bytes:
+        """
+        Encode a chart at the configured resolution, format and compression
+        
+        Figures use constrained layout, which fits the margins as part of
+        the save itself. So the figure is saved as-is rather than with
+        bbox_inches='tight', which would render it a second time to
+        measure its extents.
+        
+        Args:
+            fig: Figure to encode
+            
+        Returns:
+            bytes: Encoded image data
+        """
+        if self.output_format == 'jpg':
+            pil_kwargs = JPEG_OPTIONS
+        else:
+            pil_kwargs = {'compress_level': self.png_compress_level}
+        
+        buffer = io.BytesIO()
+        fig.savefig(
+            buffer, format=self.output_format, dpi=self.dpi, pil_kwargs=pil_kwargs
+        )
+        return buffer.getvalue()
+    
+    def _image_bytes(self, image: Image.Image) -> bytes:
+        """
+        Encode a Pillow image in the configured format and compression
+        
+        Args:
+            image: Image to encode
+            
+        Returns:
+            bytes: Encoded image data
+        """
+        buffer = io.BytesIO()
+        if self.output_format == 'jpg':
+            image.save(buffer, 'JPEG', **JPEG_OPTIONS)
+        else:
+            image.save(buffer, 'PNG', compress_level=self.png_compress_level)
+        return buffer.getvalue()
+    
+    def _fast_bar_chart(
+        self,
+        values: np.ndarray,
+        bar_labels: Tuple[str, ...],
+        title: str,
+        xlabel: str,
+        ylabel: str,
+        value_format,
+        value_fontsize: int,
+        ymax: Optional[float] = None,
+        reference: Optional[float] = None
+    ) -> bytes:
+        """
+        Draw a simple bar chart with Pillow, styled like the matplotlib ones
+        
+        Args:
+            values: Bar heights, one per metric color
+            bar_labels: Category label under each bar
+            title: Chart title
+            xlabel: X axis label
+            ylabel: Y axis label
+            value_format: Function formatting a value as its bar label
+            value_fontsize: Bar label font size in points
+            ymax: Top of the y axis (defaults to just above the tallest bar)
+            reference: Value to mark with a dashed line, if any
+            
+        Returns:
+            bytes: Encoded chart image
+        """
+        # Sizes are given in points, as for matplotlib
+        scale = self.dpi / 72
+        width = round(self.figure_size[0] * self.dpi)
+        height = round(self.figure_size[1] * self.dpi)
+        image = Image.new('RGB', (width, height), 'white')
+        draw = ImageDraw.Draw(image)
+        
+        title_font = _pil_font(round(18 * scale))
+        label_font = _pil_font(round(14 * scale))
+        tick_font = _pil_font(round(12 * scale))
+        value_font = _pil_font(round(value_fontsize * scale))
+        
+        # Plot area
+        left, right = round(width * 0.1), round(width * 0.97)
+        top, bottom = round(height * 0.16), round(height * 0.82)
+        if ymax is None:
+            ymax = float(values.max()) * 1.05
+        if ymax <= 0:
+            ymax = 1.0
+        
+        def y_pixel(value: float) -> float:
+            return bottom - (bottom - top) * min(value, ymax) / ymax
+        
+        # Grid lines with y tick labels
+        step = _tick_step(ymax)
+        for tick in np.arange(0, ymax + step / 1000, step):
+            y = y_pixel(tick)
+            draw.line([(left, y), (right, y)], fill=FAST_GRID_COLOR)
+            draw.text(
+                (left - 6 * scale, y), f'{tick:g}',
+                font=tick_font, fill=FAST_TEXT_COLOR, anchor='rm'
+            )
+        
+        if reference is not None and reference <= ymax:
+            y = y_pixel(reference)
+            dash = round(4 * scale)
+            for x in range(left, right, dash * 2):
+                draw.line([(x, y), (min(x + dash, right), y)], fill=(160, 160, 160))
+        
+        # Bars are blended with white like matplotlib's alpha=0.8
+        slot = (right - left) / len(values)
+        outline_width = max(1, round(1.5 * scale))
+        for i, (value, bar_label, color) in enumerate(
+            zip(values, bar_labels, self._metric_colors)
+        ):
+            fill = tuple(round(c * 0.8 + 255 * 0.2) for c in ImageColor.getrgb(color))
+            x0 = left + slot * (i + 0.1)
+            x1 = left + slot * (i + 0.9)
+            y = y_pixel(value)
+            draw.rectangle(
+                [x0, y, x1, bottom], fill=fill, outline='black', width=outline_width
+            )
+            draw.text(
+                ((x0 + x1) / 2, y - 2 * scale), value_format(value),
+                font=value_font, fill=FAST_TEXT_COLOR, anchor='md'
+            )
+            draw.multiline_text(
+                ((x0 + x1) / 2, bottom + 5 * scale), bar_label,
+                font=tick_font, fill=FAST_TEXT_COLOR, anchor='ma', align='center'
+            )
+        
+        # Left and bottom spines
+        draw.line([(left, top), (left, bottom), (right, bottom)], fill=FAST_AXIS_COLOR)
+        
+        # Titles and axis labels
+        draw.multiline_text(
+            (width / 2, 6 * scale), title,
+            font=title_font, fill=FAST_TEXT_COLOR, anchor='ma', align='center'
+        )
+        draw.text(
+            ((left + right) / 2, height - 6 * scale), xlabel,
+            font=label_font, fill=FAST_TEXT_COLOR, anchor='md'
+        )
+        
+        # Pillow can't draw rotated text, so draw the y label onto a mask
+        # and paste it in rotated
+        x0, y0, x1, y1 = label_font.getbbox(ylabel)
+        mask = Image.new('L', (x1 - x0, y1 - y0))
+        ImageDraw.Draw(mask).text((-x0, -y0), ylabel, font=label_font, fill=255)
+        mask = mask.rotate(90, expand=True)
+        image.paste(
+            FAST_TEXT_COLOR,
+            (round(6 * scale), round((top + bottom - mask.height) / 2)),
+            mask
+        )
+        
+        return self._image_bytes(image)
+    
+    def _compute_output_dir(self, person_name: str) -> Path:
+        """
+        Build the output directory path for a person
         
         Args:
             person_name: Name of the lead generator
@@ -59,176 +596,511 @@ class ChartGenerator:
         Returns:
             Path: Path to output directory
         """
-        # Create safe filename from person name
-        safe_name = "".join(c if c.isalnum() or c in (' ', '_') else '_' 
-                           for c in person_name).strip().replace(' ', '_').lower()
-        
         # Add timestamp to directory name
-        from datetime import datetime
-        timestamp = datetime.now().strftime('%Y-%m-%d')
+        return Path(self.output_dir) / f"{self._safe_name(person_name)}_{self._today}"
+    
+    def _safe_name(self, person_name: str) -> str:
+        """
+        Create a safe file name from a person name
+        
+        Args:
+            person_name: Name of the lead generator
+            
+        Returns:
+            str: Lowercase name with unsafe characters replaced by '_'
+        """
+        if person_name.isascii():
+            safe_name = person_name.translate(_UNSAFE_ASCII)
+        else:
+            safe_name = _UNSAFE_CHARS.sub('_', person_name)
+        return safe_name.strip().replace(' ', '_').lower()
+    
+    def _chart_hashes_path(self, person_name: str) -> Path:
+        """
+        Get the file recording the input hashes of a person's charts
+        
+        Each person has a file of their own, so reports rendered in
+        separate processes never write the same file.
+        
+        Args:
+            person_name: Name of the lead generator
+            
+        Returns:
+            Path: Path to the JSON file
+        """
+        return Path(self.output_dir) / '.chart_hashes' / f"{self._safe_name(person_name)}.json"
+    
+    def _load_chart_hashes(self, person_name: str) -> Dict[str, Dict[str, str]]:
+        """
+        Read the input hashes of a person's last rendered charts
+        
+        Args:
+            person_name: Name of the lead generator
+            
+        Returns:
+            Dict: Chart name to {'hash', 'path'}, empty if none are stored
+        """
+        try:
+            with open(self._chart_hashes_path(person_name), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_chart_hashes(self, person_name: str, hashes: Dict[str, Dict[str, str]]):
+        """
+        Record the input hashes of a person's rendered charts
+        
+        Args:
+            person_name: Name of the lead generator
+            hashes: Chart name to {'hash', 'path'}
+        """
+        path = self._chart_hashes_path(person_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(hashes, f)
+    
+    def _reuse_chart(self, stored: Optional[Dict[str, str]], input_hash: str, output_path: Path) -> Optional[str]:
+        """
+        Reuse a previously rendered chart if its inputs are unchanged
+        
+        A chart rendered on an earlier day is copied into today's
+        directory, which is far cheaper than rendering it again.
+        
+        Args:
+            stored: Stored {'hash', 'path'} for the chart, if any
+            input_hash: Hash of the chart's current inputs
+            output_path: Directory the chart belongs in
+            
+        Returns:
+            str: Path to the chart, or None if it must be rendered
+        """
+        if stored is None or stored['hash'] != input_hash:
+            return None
+        
+        source = Path(stored['path'])
+        if not source.exists():
+            return None
+        
+        filepath = output_path / source.name
+        if filepath != source:
+            shutil.copyfile(source, filepath)
+        return str(filepath)
+    
+    def _ensure_dir(self, path: Path) -> Path:
+        """
+        Create a directory if it doesn't exist
         
-        output_path = Path(self.output_dir) / f"{safe_name}_{timestamp}"
-        output_path.mkdir(parents=True, exist_ok=True)
+        Args:
+            path: Directory to create
+            
+        Returns:
+            Path: The same path
+        """
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    
+    def _ensure_output_dir(self, person_name: str) -> Path:
+        """
+        Create output directory for person if it doesn't exist
+        
+        The directory is only created the first time a person is seen.
         
+        Args:
+            person_name: Name of the lead generator
+            
+        Returns:
+            Path: Path to output directory
+        """
+        output_path = self._output_dirs.get(person_name)
+        if output_path is None:
+            output_path = self._ensure_dir(self._compute_output_dir(person_name))
+            self._output_dirs[person_name] = output_path
         return output_path
     
-    def generate_kpi_bar_chart(
+    def _draw_kpi_bar_chart(
         self,
+        ax,
         totals: Dict[str, float],
         person_name: str,
         date_range: str
-    ) -> str:
+    ) -> tuple:
         """
-        Generate bar chart for 4 main KPIs
+        Draw the bar chart of the 4 main KPIs
         
         Args:
+            ax: Axes to draw on
             totals: Dictionary with total metrics
             person_name: Name of lead generator
             date_range: Date range string for title
             
         Returns:
-            str: Path to saved chart
+            tuple: (bars, value labels), for updating the chart in place
         """
-        fig, ax = plt.subplots(figsize=self.figure_size)
-        
         # Prepare data
-        metrics = ['Doors\nKnocked', 'Homeowners\nTalked', 
-                   'Qualified\nLeads', 'Appointments\nSet']
-        values = [
-            totals['doors_knocked'],
-            totals['homeowners_talked'],
-            totals['qualified_leads'],
-            totals['appointments_set']
-        ]
-        colors_list = [
-            self.colors['primary'],
-            self.colors['warning'],
-            self.colors['success'],
-            self.colors['secondary']
-        ]
+        values = self._metric_values(totals)
         
         # Create bars
-        bars = ax.bar(metrics, values, color=colors_list, alpha=0.8, edgecolor='black', linewidth=1.5)
+        bars = ax.bar(METRIC_LABELS, values, color=self._metric_colors, alpha=0.8, edgecolor='black', linewidth=1.5)
         
         # Add value labels on bars
+        labels = []
         for bar in bars:
             height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
+            labels.append(ax.text(bar.get_x() + bar.get_width()/2., height,
                    f'{int(height)}',
-                   ha='center', va='bottom', fontsize=14, fontweight='bold')
+                   ha='center', va='bottom', fontsize=14, fontweight='bold'))
+        
+        # Styling
+        self._set_title(ax, 'Performance Metrics', person_name, date_range)
+        ax.set_ylabel('Count', fontdict=AXIS_LABEL_FONT)
+        ax.set_xlabel('Metrics', fontdict=AXIS_LABEL_FONT)
+        ax.tick_params(labelsize=12)
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.grid(axis='y', alpha=0.3)
+        
+        return list(bars), labels
+    
+    def _update_kpi_bar_chart(
+        self,
+        template: _ChartTemplate,
+        totals: Dict[str, float],
+        person_name: str,
+        date_range: str
+    ):
+        """
+        Redraw a KPI bar chart template with another person's totals
+        
+        Args:
+            template: Chart drawn by _draw_kpi_bar_chart
+            totals: Dictionary with total metrics
+            person_name: Name of lead generator
+            date_range: Date range string for title
+        """
+        values = self._metric_values(totals)
+        self._update_bar_labels(template, values, lambda v: f'{int(v)}')
+        self._set_title(template.ax, 'Performance Metrics', person_name, date_range)
+        template.ax.relim()
+        template.ax.autoscale_view()
+    
+    def generate_kpi_bar_chart_bytes(
+        self,
+        totals: Dict[str, float],
+        person_name: str,
+        date_range: str
+    ) -> bytes:
+        """
+        Generate bar chart for 4 main KPIs
+        
+        Returns the encoded image instead of writing a file.
+        
+        Args:
+            totals: Dictionary with total metrics
+            person_name: Name of lead generator
+            date_range: Date range string for title
+            
+        Returns:
+            bytes: Chart in the configured output format
+        """
+        if self.fast_mode:
+            return self._fast_bar_chart(
+                self._metric_values(totals), METRIC_LABELS,
+                f'Performance Metrics - {person_name}\n{date_range}',
+                'Metrics', 'Count', lambda v: f'{int(v)}', 14
+            )
+        
+        template = self._templates.get('kpi_metrics')
+        if template is None:
+            template = self._new_template(
+                self._draw_kpi_bar_chart, totals, person_name, date_range
+            )
+            self._templates['kpi_metrics'] = template
+        else:
+            self._update_kpi_bar_chart(template, totals, person_name, date_range)
+        fig = template.fig
+        
+        return self._figure_bytes(fig)
+    
+    def generate_kpi_bar_chart(
+        self,
+        totals: Dict[str, float],
+        person_name: str,
+        date_range: str,
+        output_path: Optional[Path] = None
+    ) -> str:
+        """
+        Generate bar chart for 4 main KPIs
+        
+        Args:
+            totals: Dictionary with total metrics
+            person_name: Name of lead generator
+            date_range: Date range string for title
+            output_path: Directory to save into (defaults to the
+                person's output directory)
+            
+        Returns:
+            str: Path to saved chart
+        """
+        data = self.generate_kpi_bar_chart_bytes(
+            totals, person_name, date_range
+        )
+        
+        # Save
+        if output_path is None:
+            output_path = self._ensure_output_dir(person_name)
+        filepath = output_path / f'kpi_metrics.{self.output_format}'
+        filepath.write_bytes(data)
+        
+        return str(filepath)
+    
+    def _draw_conversion_funnel(
+        self,
+        ax,
+        totals: Dict[str, float],
+        rates: Dict[str, float],
+        person_name: str,
+        date_range: str
+    ) -> tuple:
+        """
+        Draw the funnel of conversion through the stages
+        
+        Args:
+            ax: Axes to draw on
+            totals: Dictionary with total metrics
+            rates: Dictionary with conversion rates
+            person_name: Name of lead generator
+            date_range: Date range string for title
+            
+        Returns:
+            tuple: (bars, value labels, rate labels), for updating the
+                chart in place
+        """
+        # Funnel data
+        values = self._metric_values(totals)
+        
+        # Calculate funnel widths (normalized)
+        normalized_values = self._funnel_widths(values)
+        
+        # Create horizontal funnel
+        y_positions = np.arange(len(METRIC_KEYS))
+        
+        # Draw funnel bars
+        bars = ax.barh(y_positions, normalized_values, color=self._metric_colors, 
+                      alpha=0.8, edgecolor='black', linewidth=2)
+        
+        # Add labels with values and conversion rates
+        labels = []
+        rate_labels = []
+        for i, (bar, value) in enumerate(zip(bars, values)):
+            width = bar.get_width()
+            # Value label
+            labels.append(ax.text(width + 0.02, bar.get_y() + bar.get_height()/2,
+                   f'{int(value)}',
+                   ha='left', va='center', fontsize=13, fontweight='bold'))
+            
+            # Conversion rate label (skip first stage)
+            if i > 0:
+                rate_val = rates[RATE_KEYS[i-1]]
+                rate_labels.append(ax.text(width/2, bar.get_y() + bar.get_height()/2,
+                       f'{rate_val:.1f}%',
+                       ha='center', va='center', fontsize=11, 
+                       fontweight='bold', color='white'))
+        
+        # Styling
+        ax.set_yticks(y_positions)
+        ax.set_yticklabels(METRIC_LABELS, fontsize=12)
+        ax.set_xlim(0, 1.2)
+        ax.set_xlabel('Conversion Progress', fontdict=AXIS_LABEL_FONT)
+        self._set_title(ax, 'Sales Funnel', person_name, date_range)
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['bottom'].set_visible(False)
+        ax.set_xticks([])
+        ax.grid(False)
+        
+        return list(bars), labels, rate_labels
+    
+    def _update_conversion_funnel(
+        self,
+        template: _ChartTemplate,
+        totals: Dict[str, float],
+        rates: Dict[str, float],
+        person_name: str,
+        date_range: str
+    ):
+        """
+        Redraw a funnel template with another person's totals and rates
+        
+        Args:
+            template: Chart drawn by _draw_conversion_funnel
+            totals: Dictionary with total metrics
+            rates: Dictionary with conversion rates
+            person_name: Name of lead generator
+            date_range: Date range string for title
+        """
+        values = self._metric_values(totals)
+        
+        # Calculate funnel widths (normalized)
+        normalized_values = self._funnel_widths(values)
+        
+        # The axis limits are fixed, so only the bars and labels move
+        for bar, label, value, width in zip(
+            template.bars, template.labels, values, normalized_values
+        ):
+            bar.set_width(width)
+            label.set_position((width + 0.02, bar.get_y() + bar.get_height()/2))
+            label.set_text(f'{int(value)}')
+        
+        for bar, label, rate_key in zip(
+            template.bars[1:], template.rate_labels, RATE_KEYS
+        ):
+            label.set_position((bar.get_width()/2, bar.get_y() + bar.get_height()/2))
+            label.set_text(f'{rates[rate_key]:.1f}%')
+        
+        self._set_title(template.ax, 'Sales Funnel', person_name, date_range)
+    
+    def generate_conversion_funnel_bytes(
+        self,
+        totals: Dict[str, float],
+        rates: Dict[str, float],
+        person_name: str,
+        date_range: str
+    ) -> bytes:
+        """
+        Generate funnel chart showing conversion through stages
+        
+        Returns the encoded image instead of writing a file.
+        
+        Args:
+            totals: Dictionary with total metrics
+            rates: Dictionary with conversion rates
+            person_name: Name of lead generator
+            date_range: Date range string
+            
+        Returns:
+            bytes: Chart in the configured output format
+        """
+        template = self._templates.get('conversion_funnel')
+        if template is None:
+            template = self._new_template(
+                self._draw_conversion_funnel, totals, rates, person_name, date_range
+            )
+            self._templates['conversion_funnel'] = template
+        else:
+            self._update_conversion_funnel(template, totals, rates, person_name, date_range)
+        fig = template.fig
+        
+        return self._figure_bytes(fig)
+    
+    def generate_conversion_funnel(
+        self,
+        totals: Dict[str, float],
+        rates: Dict[str, float],
+        person_name: str,
+        date_range: str,
+        output_path: Optional[Path] = None
+    ) -> str:
+        """
+        Generate funnel chart showing conversion through stages
+        
+        Args:
+            totals: Dictionary with total metrics
+            rates: Dictionary with conversion rates
+            person_name: Name of lead generator
+            date_range: Date range string
+            output_path: Directory to save into (defaults to the
+                person's output directory)
+            
+        Returns:
+            str: Path to saved chart
+        """
+        data = self.generate_conversion_funnel_bytes(
+            totals, rates, person_name, date_range
+        )
+        
+        # Save
+        if output_path is None:
+            output_path = self._ensure_output_dir(person_name)
+        filepath = output_path / f'conversion_funnel.{self.output_format}'
+        filepath.write_bytes(data)
+        
+        return str(filepath)
+    
+    def _draw_daily_trends(
+        self,
+        ax,
+        daily_df: pd.DataFrame,
+        column_mapping: Dict[str, str],
+        person_name: str,
+        date_range: str
+    ):
+        """
+        Draw the line chart of daily trends
+        
+        Args:
+            ax: Axes to draw on
+            daily_df: DataFrame with daily aggregated data
+            column_mapping: Column name mapping
+            person_name: Name of lead generator
+            date_range: Date range string for title
+        """
+        # Convert date to datetime for plotting, leaving the caller's
+        # DataFrame as it is
+        dates = pd.to_datetime(daily_df['date'].to_numpy())
+        
+        # Plot a line for each metric in one call, one per column
+        columns = [column_mapping[key] for key in METRIC_KEYS]
+        lines = ax.plot(dates, daily_df[columns].to_numpy(), 
+                       marker='o', linewidth=2.5, markersize=6, alpha=0.8)
+        for line, label, color in zip(lines, METRIC_NAMES, self._metric_colors):
+            line.set_label(label)
+            line.set_color(color)
         
         # Styling
-        ax.set_title(f'Performance Metrics - {person_name}\n{date_range}', 
-                    fontsize=18, fontweight='bold', pad=20)
-        ax.set_ylabel('Count', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Metrics', fontsize=14, fontweight='bold')
-        ax.tick_params(labelsize=12)
+        self._set_title(ax, 'Daily Performance Trends', person_name, date_range)
+        ax.set_xlabel('Date', fontdict=AXIS_LABEL_FONT)
+        ax.set_ylabel('Count', fontdict=AXIS_LABEL_FONT)
+        ax.legend(loc='best', fontsize=11, framealpha=0.9)
+        ax.grid(True, alpha=0.3)
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
-        ax.grid(axis='y', alpha=0.3)
-        
-        plt.tight_layout()
         
-        # Save
-        output_path = self._ensure_output_dir(person_name)
-        filepath = output_path / 'kpi_metrics.png'
-        plt.savefig(filepath, dpi=self.dpi, bbox_inches='tight')
-        plt.close()
-        
-        return str(filepath)
+        # Rotate x-axis labels for better readability
+        _get_pyplot().setp(ax.get_xticklabels(), rotation=45, ha='right')
     
-    def generate_conversion_funnel(
+    def generate_daily_trends_bytes(
         self,
-        totals: Dict[str, float],
-        rates: Dict[str, float],
+        daily_df: pd.DataFrame,
+        column_mapping: Dict[str, str],
         person_name: str,
         date_range: str
-    ) -> str:
+    ) -> bytes:
         """
-        Generate funnel chart showing conversion through stages
+        Generate line chart showing daily trends
+        
+        Returns the encoded image instead of writing a file.
         
         Args:
-            totals: Dictionary with total metrics
-            rates: Dictionary with conversion rates
+            daily_df: DataFrame with daily aggregated data
+            column_mapping: Column name mapping
             person_name: Name of lead generator
             date_range: Date range string
             
         Returns:
-            str: Path to saved chart
+            bytes: Chart in the configured output format
         """
-        fig, ax = plt.subplots(figsize=self.figure_size)
-        
-        # Funnel data
-        stages = ['Doors\nKnocked', 'Homeowners\nTalked', 'Qualified\nLeads', 'Appointments\nSet']
-        values = [
-            totals['doors_knocked'],
-            totals['homeowners_talked'],
-            totals['qualified_leads'],
-            totals['appointments_set']
-        ]
-        
-        # Calculate funnel widths (normalized)
-        if values[0] > 0:
-            normalized_values = [v / values[0] for v in values]
-        else:
-            normalized_values = [0, 0, 0, 0]
-        
-        # Create horizontal funnel
-        colors_list = [self.colors['primary'], self.colors['warning'], 
-                      self.colors['success'], self.colors['secondary']]
-        
-        y_positions = list(range(len(stages)))
-        
-        # Draw funnel bars
-        bars = ax.barh(y_positions, normalized_values, color=colors_list, 
-                      alpha=0.8, edgecolor='black', linewidth=2)
-        
-        # Add labels with values and conversion rates
-        for i, (bar, value) in enumerate(zip(bars, values)):
-            width = bar.get_width()
-            # Value label
-            ax.text(width + 0.02, bar.get_y() + bar.get_height()/2,
-                   f'{int(value)}',
-                   ha='left', va='center', fontsize=13, fontweight='bold')
-            
-            # Conversion rate label (skip first stage)
-            if i > 0:
-                rate_key = ['talk_rate', 'qualification_rate', 'appointment_rate'][i-1]
-                rate_val = rates[rate_key]
-                ax.text(width/2, bar.get_y() + bar.get_height()/2,
-                       f'{rate_val:.1f}%',
-                       ha='center', va='center', fontsize=11, 
-                       fontweight='bold', color='white')
-        
-        # Styling
-        ax.set_yticks(y_positions)
-        ax.set_yticklabels(stages, fontsize=12)
-        ax.set_xlim(0, 1.2)
-        ax.set_xlabel('Conversion Progress', fontsize=14, fontweight='bold')
-        ax.set_title(f'Sales Funnel - {person_name}\n{date_range}', 
-                    fontsize=18, fontweight='bold', pad=20)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['bottom'].set_visible(False)
-        ax.set_xticks([])
-        ax.grid(False)
-        
-        plt.tight_layout()
+        fig, ax = self._get_axes()
+        self._draw_daily_trends(ax, daily_df, column_mapping, person_name, date_range)
         
-        # Save
-        output_path = self._ensure_output_dir(person_name)
-        filepath = output_path / 'conversion_funnel.png'
-        plt.savefig(filepath, dpi=self.dpi, bbox_inches='tight')
-        plt.close()
-        
-        return str(filepath)
+        return self._figure_bytes(fig)
     
     def generate_daily_trends(
         self,
         daily_df: pd.DataFrame,
         column_mapping: Dict[str, str],
         person_name: str,
-        date_range: str
+        date_range: str,
+        output_path: Optional[Path] = None
     ) -> str:
         """
         Generate line chart showing daily trends
@@ -238,83 +1110,48 @@ class ChartGenerator:
             column_mapping: Column name mapping
             person_name: Name of lead generator
             date_range: Date range string
+            output_path: Directory to save into (defaults to the
+                person's output directory)
             
         Returns:
             str: Path to saved chart
         """
-        fig, ax = plt.subplots(figsize=self.figure_size)
-        
-        # Convert date to datetime for plotting
-        daily_df = daily_df.copy()
-        daily_df['date'] = pd.to_datetime(daily_df['date'])
-        
-        # Plot lines for each metric
-        metrics = [
-            ('doors_knocked', 'Doors Knocked', self.colors['primary']),
-            ('homeowners_talked', 'Homeowners Talked', self.colors['warning']),
-            ('qualified_leads', 'Qualified Leads', self.colors['success']),
-            ('appointments_set', 'Appointments Set', self.colors['secondary'])
-        ]
-        
-        for metric_key, label, color in metrics:
-            col_name = column_mapping[metric_key]
-            ax.plot(daily_df['date'], daily_df[col_name], 
-                   marker='o', linewidth=2.5, markersize=6, 
-                   label=label, color=color, alpha=0.8)
-        
-        # Styling
-        ax.set_title(f'Daily Performance Trends - {person_name}\n{date_range}', 
-                    fontsize=18, fontweight='bold', pad=20)
-        ax.set_xlabel('Date', fontsize=14, fontweight='bold')
-        ax.set_ylabel('Count', fontsize=14, fontweight='bold')
-        ax.legend(loc='best', fontsize=11, framealpha=0.9)
-        ax.grid(True, alpha=0.3)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        
-        # Rotate x-axis labels for better readability
-        plt.xticks(rotation=45, ha='right')
-        
-        plt.tight_layout()
+        data = self.generate_daily_trends_bytes(
+            daily_df, column_mapping, person_name, date_range
+        )
         
         # Save
-        output_path = self._ensure_output_dir(person_name)
-        filepath = output_path / 'daily_trends.png'
-        plt.savefig(filepath, dpi=self.dpi, bbox_inches='tight')
-        plt.close()
+        if output_path is None:
+            output_path = self._ensure_output_dir(person_name)
+        filepath = output_path / f'daily_trends.{self.output_format}'
+        filepath.write_bytes(data)
         
         return str(filepath)
     
-    def generate_team_comparison(
+    def _draw_team_comparison(
         self,
+        ax,
         comparison: Dict[str, Dict[str, float]],
         person_name: str,
         date_range: str
-    ) -> str:
+    ) -> tuple:
         """
-        Generate comparison chart: individual vs team average
+        Draw the individual vs team average comparison
         
         Args:
+            ax: Axes to draw on
             comparison: Comparison metrics dictionary
             person_name: Name of lead generator
-            date_range: Date range string
+            date_range: Date range string for title
             
         Returns:
-            str: Path to saved chart
+            tuple: (bars, value labels), for updating the chart in place
         """
-        fig, ax = plt.subplots(figsize=self.figure_size)
-        
         # Prepare data
-        metrics = ['Doors\nKnocked', 'Homeowners\nTalked', 
-                   'Qualified\nLeads', 'Appointments\nSet']
-        metric_keys = ['doors_knocked', 'homeowners_talked', 
-                      'qualified_leads', 'appointments_set']
-        
-        individual_values = [comparison[key]['individual'] for key in metric_keys]
-        team_values = [comparison[key]['team_average'] for key in metric_keys]
+        individual_values, team_values = self._comparison_values(comparison)
         
         # Set up bar positions
-        x = np.arange(len(metrics))
+        x = np.arange(len(METRIC_KEYS))
         width = 0.35
         
         # Create grouped bars
@@ -326,100 +1163,260 @@ class ChartGenerator:
                       alpha=0.8, edgecolor='black', linewidth=1.5)
         
         # Add value labels
+        labels = []
         for bars in [bars1, bars2]:
             for bar in bars:
                 height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
+                labels.append(ax.text(bar.get_x() + bar.get_width()/2., height,
                        f'{int(height)}',
-                       ha='center', va='bottom', fontsize=11, fontweight='bold')
+                       ha='center', va='bottom', fontsize=11, fontweight='bold'))
         
         # Styling
-        ax.set_title(f'Performance vs Team Average - {person_name}\n{date_range}', 
-                    fontsize=18, fontweight='bold', pad=20)
-        ax.set_ylabel('Count', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Metrics', fontsize=14, fontweight='bold')
+        self._set_title(ax, 'Performance vs Team Average', person_name, date_range)
+        ax.set_ylabel('Count', fontdict=AXIS_LABEL_FONT)
+        ax.set_xlabel('Metrics', fontdict=AXIS_LABEL_FONT)
         ax.set_xticks(x)
-        ax.set_xticklabels(metrics, fontsize=12)
+        ax.set_xticklabels(METRIC_LABELS, fontsize=12)
         ax.legend(fontsize=12, framealpha=0.9)
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.grid(axis='y', alpha=0.3)
         
-        plt.tight_layout()
+        return list(bars1) + list(bars2), labels
+    
+    def _update_team_comparison(
+        self,
+        template: _ChartTemplate,
+        comparison: Dict[str, Dict[str, float]],
+        person_name: str,
+        date_range: str
+    ):
+        """
+        Redraw a team comparison template with another person's numbers
         
-        # Save
-        output_path = self._ensure_output_dir(person_name)
-        filepath = output_path / 'team_comparison.png'
-        plt.savefig(filepath, dpi=self.dpi, bbox_inches='tight')
-        plt.close()
+        Args:
+            template: Chart drawn by _draw_team_comparison
+            comparison: Comparison metrics dictionary
+            person_name: Name of lead generator
+            date_range: Date range string for title
+        """
+        # Bars are stored individual values first, then team averages
+        values = self._comparison_values(comparison).ravel()
         
-        return str(filepath)
+        self._update_bar_labels(template, values, lambda v: f'{int(v)}')
+        self._set_title(
+            template.ax, 'Performance vs Team Average', person_name, date_range
+        )
+        template.ax.relim()
+        template.ax.autoscale_view()
     
-    def generate_conversion_rates_chart(
+    def generate_team_comparison_bytes(
         self,
-        rates: Dict[str, float],
+        comparison: Dict[str, Dict[str, float]],
         person_name: str,
         date_range: str
+    ) -> bytes:
+        """
+        Generate comparison chart: individual vs team average
+        
+        Returns the encoded image instead of writing a file.
+        
+        Args:
+            comparison: Comparison metrics dictionary
+            person_name: Name of lead generator
+            date_range: Date range string
+            
+        Returns:
+            bytes: Chart in the configured output format
+        """
+        template = self._templates.get('team_comparison')
+        if template is None:
+            template = self._new_template(
+                self._draw_team_comparison, comparison, person_name, date_range
+            )
+            self._templates['team_comparison'] = template
+        else:
+            self._update_team_comparison(template, comparison, person_name, date_range)
+        fig = template.fig
+        
+        return self._figure_bytes(fig)
+    
+    def generate_team_comparison(
+        self,
+        comparison: Dict[str, Dict[str, float]],
+        person_name: str,
+        date_range: str,
+        output_path: Optional[Path] = None
     ) -> str:
         """
-        Generate chart showing conversion rates as percentages
+        Generate comparison chart: individual vs team average
         
         Args:
-            rates: Dictionary with conversion rates
+            comparison: Comparison metrics dictionary
             person_name: Name of lead generator
             date_range: Date range string
+            output_path: Directory to save into (defaults to the
+                person's output directory)
             
         Returns:
             str: Path to saved chart
         """
-        fig, ax = plt.subplots(figsize=self.figure_size)
+        data = self.generate_team_comparison_bytes(
+            comparison, person_name, date_range
+        )
         
-        # Prepare data
-        rate_labels = ['Talk\nRate', 'Qualification\nRate', 
-                      'Appointment\nRate', 'Overall\nConversion']
-        rate_keys = ['talk_rate', 'qualification_rate', 
-                    'appointment_rate', 'overall_conversion']
-        rate_values = [rates[key] for key in rate_keys]
+        # Save
+        if output_path is None:
+            output_path = self._ensure_output_dir(person_name)
+        filepath = output_path / f'team_comparison.{self.output_format}'
+        filepath.write_bytes(data)
+        
+        return str(filepath)
+    
+    def _draw_conversion_rates_chart(
+        self,
+        ax,
+        rates: Dict[str, float],
+        person_name: str,
+        date_range: str
+    ) -> tuple:
+        """
+        Draw the conversion rates as percentages
         
-        colors_list = [self.colors['primary'], self.colors['warning'], 
-                      self.colors['success'], self.colors['secondary']]
+        Args:
+            ax: Axes to draw on
+            rates: Dictionary with conversion rates
+            person_name: Name of lead generator
+            date_range: Date range string for title
+            
+        Returns:
+            tuple: (bars, value labels), for updating the chart in place
+        """
+        # Prepare data
+        rate_values = self._rate_values(rates)
         
         # Create bars
-        bars = ax.bar(rate_labels, rate_values, color=colors_list, 
+        bars = ax.bar(RATE_LABELS, rate_values, color=self._metric_colors, 
                      alpha=0.8, edgecolor='black', linewidth=1.5)
         
         # Add percentage labels
+        labels = []
         for bar in bars:
             height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
+            labels.append(ax.text(bar.get_x() + bar.get_width()/2., height,
                    f'{height:.1f}%',
-                   ha='center', va='bottom', fontsize=13, fontweight='bold')
+                   ha='center', va='bottom', fontsize=13, fontweight='bold'))
         
         # Add reference line at 100%
         ax.axhline(y=100, color='gray', linestyle='--', alpha=0.5, linewidth=1)
         
         # Styling
-        ax.set_title(f'Conversion Rates - {person_name}\n{date_range}', 
-                    fontsize=18, fontweight='bold', pad=20)
-        ax.set_ylabel('Percentage (%)', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Conversion Metrics', fontsize=14, fontweight='bold')
+        self._set_title(ax, 'Conversion Rates', person_name, date_range)
+        ax.set_ylabel('Percentage (%)', fontdict=AXIS_LABEL_FONT)
+        ax.set_xlabel('Conversion Metrics', fontdict=AXIS_LABEL_FONT)
         ax.tick_params(labelsize=12)
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.grid(axis='y', alpha=0.3)
-        ax.set_ylim(0, max(rate_values) * 1.2)
+        ax.set_ylim(0, rate_values.max() * 1.2)
+        
+        return list(bars), labels
+    
+    def _update_conversion_rates_chart(
+        self,
+        template: _ChartTemplate,
+        rates: Dict[str, float],
+        person_name: str,
+        date_range: str
+    ):
+        """
+        Redraw a conversion rates template with another person's rates
+        
+        Args:
+            template: Chart drawn by _draw_conversion_rates_chart
+            rates: Dictionary with conversion rates
+            person_name: Name of lead generator
+            date_range: Date range string for title
+        """
+        rate_values = self._rate_values(rates)
+        
+        self._update_bar_labels(template, rate_values, lambda v: f'{v:.1f}%')
+        self._set_title(template.ax, 'Conversion Rates', person_name, date_range)
+        template.ax.set_ylim(0, rate_values.max() * 1.2)
+    
+    def generate_conversion_rates_chart_bytes(
+        self,
+        rates: Dict[str, float],
+        person_name: str,
+        date_range: str
+    ) -> bytes:
+        """
+        Generate chart showing conversion rates as percentages
+        
+        Returns the encoded image instead of writing a file.
+        
+        Args:
+            rates: Dictionary with conversion rates
+            person_name: Name of lead generator
+            date_range: Date range string
+            
+        Returns:
+            bytes: Chart in the configured output format
+        """
+        if self.fast_mode:
+            rate_values = self._rate_values(rates)
+            return self._fast_bar_chart(
+                rate_values, RATE_LABELS,
+                f'Conversion Rates - {person_name}\n{date_range}',
+                'Conversion Metrics', 'Percentage (%)', lambda v: f'{v:.1f}%', 13,
+                ymax=float(rate_values.max()) * 1.2, reference=100
+            )
+        
+        template = self._templates.get('conversion_rates')
+        if template is None:
+            template = self._new_template(
+                self._draw_conversion_rates_chart, rates, person_name, date_range
+            )
+            self._templates['conversion_rates'] = template
+        else:
+            self._update_conversion_rates_chart(template, rates, person_name, date_range)
+        fig = template.fig
+        
+        return self._figure_bytes(fig)
+    
+    def generate_conversion_rates_chart(
+        self,
+        rates: Dict[str, float],
+        person_name: str,
+        date_range: str,
+        output_path: Optional[Path] = None
+    ) -> str:
+        """
+        Generate chart showing conversion rates as percentages
         
-        plt.tight_layout()
+        Args:
+            rates: Dictionary with conversion rates
+            person_name: Name of lead generator
+            date_range: Date range string
+            output_path: Directory to save into (defaults to the
+                person's output directory)
+            
+        Returns:
+            str: Path to saved chart
+        """
+        data = self.generate_conversion_rates_chart_bytes(
+            rates, person_name, date_range
+        )
         
         # Save
-        output_path = self._ensure_output_dir(person_name)
-        filepath = output_path / 'conversion_rates.png'
-        plt.savefig(filepath, dpi=self.dpi, bbox_inches='tight')
-        plt.close()
+        if output_path is None:
+            output_path = self._ensure_output_dir(person_name)
+        filepath = output_path / f'conversion_rates.{self.output_format}'
+        filepath.write_bytes(data)
         
         return str(filepath)
     
-    def generate_all_charts(
+    def generate_dashboard(
         self,
         person_name: str,
         totals: Dict[str, float],
@@ -428,10 +1425,98 @@ class ChartGenerator:
         comparison: Dict[str, Dict[str, float]],
         column_mapping: Dict[str, str],
         date_range: str
-    ) -> Dict[str, str]:
+    ) -> str:
+        """
+        Generate all five charts as panels of a single dashboard image
+        
+        One figure is laid out, rendered and encoded instead of five,
+        which is much cheaper than generate_all_charts when separate
+        files aren't needed.
+        
+        Args:
+            person_name: Name of lead generator
+            totals: Total metrics
+            rates: Conversion rates
+            daily_df: Daily aggregated data
+            comparison: Team comparison data
+            column_mapping: Column name mapping
+            date_range: Date range string
+            
+        Returns:
+            str: Path to saved dashboard
+        """
+        plt = _get_pyplot()
+        width, height = self.figure_size
+        fig, axes = plt.subplots(
+            2, 3, figsize=(width * 2, height * 1.75), layout='constrained'
+        )
+        
+        try:
+            self._draw_kpi_bar_chart(axes[0, 0], totals, person_name, date_range)
+            self._draw_conversion_funnel(
+                axes[0, 1], totals, rates, person_name, date_range
+            )
+            self._draw_conversion_rates_chart(
+                axes[0, 2], rates, person_name, date_range
+            )
+            self._draw_daily_trends(
+                axes[1, 0], daily_df, column_mapping, person_name, date_range
+            )
+            self._draw_team_comparison(
+                axes[1, 1], comparison, person_name, date_range
+            )
+            axes[1, 2].axis('off')
+            
+            # Save
+            filepath = self._ensure_output_dir(person_name) / f'dashboard.{self.output_format}'
+            filepath.write_bytes(self._figure_bytes(fig))
+        finally:
+            plt.close(fig)
+        
+        logger.info(f"Generated dashboard for {person_name}")
+        return str(filepath)
+    
+    def _run_charts(self, charts: Dict[str, tuple]) -> Dict:
+        """
+        Call chart methods, in the chart workers if there are any
+        
+        Args:
+            charts: Chart names mapped to (method name, arguments)
+            
+        Returns:
+            Dict: Chart names mapped to the methods' results
+        """
+        if self.workers > 0:
+            # The charts are independent, so render them side by side
+            pool = self._get_pool()
+            futures = {
+                name: pool.submit(_render_chart_in_worker, method_name, args)
+                for name, (method_name, args) in charts.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+        
+        return {
+            name: getattr(self, method_name)(*args)
+            for name, (method_name, args) in charts.items()
+        }
+    
+    def generate_all_charts(
+        self,
+        person_name: str,
+        totals: Dict[str, float],
+        rates: Dict[str, float],
+        daily_df: pd.DataFrame,
+        comparison: Dict[str, Dict[str, float]],
+        column_mapping: Dict[str, str],
+        date_range: str,
+        to_file: bool = True
+    ) -> Dict:
         """
         Generate all charts at once
         
+        Charts saved to files whose inputs and settings match the last ones
+        rendered for the person are reused instead of being rendered again.
+        
         Args:
             person_name: Name of lead generator
             totals: Total metrics
@@ -440,38 +1525,71 @@ class ChartGenerator:
             comparison: Team comparison data
             column_mapping: Column name mapping
             date_range: Date range string
+            to_file: Save the charts to the person's output directory
+                (False returns the encoded images without touching disk)
             
         Returns:
-            Dict: Dictionary mapping chart names to file paths
+            Dict: Dictionary mapping chart names to file paths, or to the
+                encoded images when to_file is False
         """
-        chart_paths = {}
+        charts = {
+            'kpi_metrics': ('generate_kpi_bar_chart', (
+                totals, person_name, date_range
+            )),
+            'conversion_funnel': ('generate_conversion_funnel', (
+                totals, rates, person_name, date_range
+            )),
+            'daily_trends': ('generate_daily_trends', (
+                daily_df, column_mapping, person_name, date_range
+            )),
+            'team_comparison': ('generate_team_comparison', (
+                comparison, person_name, date_range
+            )),
+            'conversion_rates': ('generate_conversion_rates_chart', (
+                rates, person_name, date_range
+            ))
+        }
         
-        print(f"\nGenerating charts for {person_name}...")
+        if not to_file:
+            images = self._run_charts({
+                name: (f'{method_name}_bytes', args)
+                for name, (method_name, args) in charts.items()
+            })
+            logger.info(f"Generated {len(images)} charts for {person_name}")
+            return images
         
-        chart_paths['kpi_metrics'] = self.generate_kpi_bar_chart(
-            totals, person_name, date_range
-        )
-        print("  KPI metrics chart created")
+        # Every chart goes to the same directory, so create it once
+        output_path = self._ensure_output_dir(person_name)
         
-        chart_paths['conversion_funnel'] = self.generate_conversion_funnel(
-            totals, rates, person_name, date_range
+        # Skip charts rendered before from identical inputs. The output
+        # directory is not hashed, so charts from earlier days are reused.
+        settings = (
+            CHART_CACHE_VERSION, self.dpi, self.figure_size, self.colors,
+            self.png_compress_level, self.output_format, self.fast_mode
         )
-        print("  Conversion funnel chart created")
+        stored_hashes = self._load_chart_hashes(person_name)
+        input_hashes = {}
+        chart_paths = {}
+        pending = {}
+        for name, (method_name, args) in charts.items():
+            input_hashes[name] = _hash_chart_inputs(name, settings, *args)
+            filepath = self._reuse_chart(
+                stored_hashes.get(name), input_hashes[name], output_path
+            )
+            if filepath is not None:
+                chart_paths[name] = filepath
+            else:
+                pending[name] = (method_name, args + (output_path,))
         
-        chart_paths['daily_trends'] = self.generate_daily_trends(
-            daily_df, column_mapping, person_name, date_range
-        )
-        print("  Daily trends chart created")
+        chart_paths.update(self._run_charts(pending))
         
-        chart_paths['team_comparison'] = self.generate_team_comparison(
-            comparison, person_name, date_range
-        )
-        print("  Team comparison chart created")
+        self._save_chart_hashes(person_name, {
+            name: {'hash': input_hashes[name], 'path': chart_paths[name]}
+            for name in charts
+        })
         
-        chart_paths['conversion_rates'] = self.generate_conversion_rates_chart(
-            rates, person_name, date_range
+        logger.info(
+            f"Generated {len(pending)} charts for {person_name}, "
+            f"reused {len(charts) - len(pending)}"
         )
-        print("  Conversion rates chart created")
-        
-        return chart_paths
-
+        return {name: chart_paths[name] for name in charts}
@@ -0,0 +1,134 @@
+"""
+Tests for the incremental cleaned data cache
+"""
+
+import tempfile
+import unittest
+
+import pandas as pd
+
+from src.data_cache import CleanDataCache
+from src.data_processing import DataProcessor
+
+COLUMN_MAPPING = {
+    'timestamp': 'Timestamp',
+    'name': 'Lead Generator Name',
+    'doors_knocked': 'Doors Knocked',
+    'homeowners_talked': 'Homeowners Talked',
+    'qualified_leads': 'Qualified Leads',
+    'appointments_set': 'Appointments Set'
+}
+
+HEADER = list(COLUMN_MAPPING.values())
+
+
+def _make_rows(count: int, start: int = 0) -> list:
+    """Build raw sheet rows with unformatted (integer) numeric cells"""
+    return [
+        [f'10/{i % 28 + 1}/2026 9:00:00', f'person {i % 3}', 20 + i, 10, 4, 1]
+        for i in range(start, start + count)
+    ]
+
+
+class FakeIngestion:
+    """Serves rows like GoogleSheetsIngestion and counts fetches"""
+    
+    def __init__(self, rows: list, revision: str):
+        self.rows = rows
+        self.revision = revision
+        self.fetches = 0
+    
+    def get_last_update_time(self, sheet_id: str) -> str:
+        return self.revision
+    
+    def fetch_data(self, sheet_id, worksheet_name, start_row=2, columns=None):
+        self.fetches += 1
+        # Built from Python lists, as fetch_data does, so column dtypes
+        # are inferred the same way
+        return pd.DataFrame(self.rows[max(start_row, 2) - 2:], columns=HEADER)
+
+
+class RecordingProcessor(DataProcessor):
+    """Records how many raw rows each clean_data call is given"""
+    
+    def __init__(self, column_mapping: dict):
+        super().__init__(column_mapping)
+        self.cleaned = []
+    
+    def clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        self.cleaned.append(len(df))
+        return super().clean_data(df)
+
+
+class CleanDataCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = CleanDataCache(self._tmp.name)
+        self.processor = RecordingProcessor(COLUMN_MAPPING)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _fetch(self, rows: list, revision: str) -> tuple:
+        """
+        Fetch through the cache and check the result against a full clean
+        
+        Returns:
+            tuple: Number of sheet fetches and the row counts passed to
+                clean_data
+        """
+        ingestion = FakeIngestion(rows, revision)
+        self.processor.cleaned = []
+        result = self.cache.fetch_clean_data(
+            ingestion, self.processor, 'sheet', 'Sheet1'
+        )
+        cleaned = self.processor.cleaned
+        
+        expected = DataProcessor(COLUMN_MAPPING).clean_data(
+            pd.DataFrame(rows, columns=HEADER)
+        )
+        # Parquet may bring the name categories back with a different
+        # string dtype, so names are compared as plain strings
+        name_col = COLUMN_MAPPING['name']
+        pd.testing.assert_frame_equal(
+            result.astype({name_col: str}), expected.astype({name_col: str})
+        )
+        return ingestion.fetches, cleaned
+    
+    def test_unchanged_sheet_is_not_fetched(self):
+        rows = _make_rows(5)
+        self._fetch(rows, 'r1')
+        self.assertEqual(self._fetch(rows, 'r1'), (0, []))
+    
+    def test_appended_rows_are_merged(self):
+        rows = _make_rows(5)
+        self._fetch(rows, 'r1')
+        rows = rows + _make_rows(3, start=5)
+        self.assertEqual(self._fetch(rows, 'r2'), (1, [3]))
+        rows = rows + _make_rows(1, start=8)
+        self.assertEqual(self._fetch(rows, 'r3'), (1, [1]))
+    
+    def test_edited_row_is_recleaned(self):
+        rows = _make_rows(5)
+        self._fetch(rows, 'r1')
+        rows = [list(row) for row in rows]
+        rows[2][2] = 99
+        self.assertEqual(self._fetch(rows, 'r2'), (1, [5]))
+    
+    def test_edit_with_appended_rows_is_recleaned(self):
+        rows = _make_rows(5)
+        self._fetch(rows, 'r1')
+        rows = [list(row) for row in rows] + _make_rows(2, start=5)
+        rows[1][3] = 0
+        self.assertEqual(self._fetch(rows, 'r2'), (1, [7]))
+    
+    def test_deleted_row_is_recleaned(self):
+        rows = _make_rows(5)
+        self._fetch(rows, 'r1')
+        rows = rows[:1] + rows[2:] + _make_rows(2, start=5)
+        self.assertEqual(self._fetch(rows, 'r2'), (1, [6]))
+        self.assertEqual(self._fetch(rows[:3], 'r3'), (1, [3]))
+
+if __name__ == '__main__':
+    unittest.main()